@@ -12,26 +12,45 @@ Usage:
 """
 
 import asyncio
+import atexit
+import functools
+import hashlib
 import json
 import logging
 import os
 import re
+import shlex
 import shutil
+import signal
+import subprocess
 import sys
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType, NoneType, UnionType
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
 
 import yaml
-from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
 from rich.console import Console
 from rich.logging import RichHandler
-from rich.table import Table
 
-import mcp.server.stdio
-import mcp.types as types
-from mcp.server.lowlevel import Server
+# The MCP server stack and rich.table are imported where they are used, so
+# `climax validate` / `climax list` don't pay for loading them at startup.
+if TYPE_CHECKING:
+    from mcp.server.lowlevel import Server
+
+# Prefer the libyaml-backed loader; fall back to pure Python when PyYAML
+# was built without libyaml.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlLoader
 
 # Rich logging to stderr (stdout is reserved for MCP stdio transport)
 console = Console(stderr=True)
@@ -49,15 +68,25 @@ logger = logging.getLogger("climax")
 
 CONFIGS_DIR = Path(__file__).parent / "configs"
 
+
+def _configure_file_handler(log: logging.Logger, path: str) -> logging.FileHandler:
+    """Attach a DEBUG-level FileHandler writing to path and return it."""
+    handler = logging.FileHandler(path)
+    handler.setFormatter(logging.Formatter(
+        "%(asctime)s %(levelname)-8s %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    ))
+    handler.setLevel(logging.DEBUG)
+    log.addHandler(handler)
+    return handler
+
+
 # Optional file log: set CLIMAX_LOG_FILE to enable persistent logging
 _log_file = os.environ.get("CLIMAX_LOG_FILE")
 if _log_file:
-    _file_handler = logging.FileHandler(_log_file)
-    _file_handler.setFormatter(logging.Formatter(
-        "%(asctime)s %(levelname)-8s %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    ))
-    _file_handler.setLevel(logging.DEBUG)
-    logger.addHandler(_file_handler)
+    _file_handler = _configure_file_handler(logger, _log_file)
+
+# Optional on-disk cache of parsed configs: set CLIMAX_CACHE_DIR to enable
+_config_cache_dir = os.environ.get("CLIMAX_CACHE_DIR")
 
 
 # ---------------------------------------------------------------------------
@@ -73,6 +102,8 @@ class ArgType(str, Enum):
 
 class ToolArg(BaseModel):
     """A single argument for a CLI tool."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str = ""
     type: ArgType = ArgType.string
@@ -85,17 +116,51 @@ class ToolArg(BaseModel):
     enum: list[str] | None = None    # restrict to specific values
 
 
+def _check_shell_words(value: str) -> str:
+    """Reject commands that shlex cannot split (e.g. unbalanced quotes)."""
+    try:
+        shlex.split(value)
+    except ValueError as e:
+        raise ValueError(f"cannot split command {value!r}: {e}") from None
+    return value
+
+
+# In-process handlers for trivial read-only tools: (arguments, working_dir) -> (returncode, stdout, stderr).
+# A tool with ``builtin:`` set is answered by its handler instead of spawning a subprocess.
+_BuiltinHandler = Callable[[dict[str, Any], str | None], tuple[int, str, str]]
+
+_BUILTINS: dict[str, _BuiltinHandler] = {
+    "noop": lambda arguments, working_dir: (0, "", ""),
+    "echo_json": lambda arguments, working_dir: (0, json.dumps(arguments, sort_keys=True), ""),
+    "pwd": lambda arguments, working_dir: (0, os.path.abspath(working_dir or os.getcwd()), ""),
+}
+
+
 class ToolDef(BaseModel):
     """A single tool that maps to a CLI subcommand."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str                 # required — shown to the LLM, avoids leaking command details
     command: str = ""                # subcommand(s) appended to base, e.g. "users list"
     args: list[ToolArg] = Field(default_factory=list)
     timeout: float | None = None     # per-tool timeout in seconds (overrides default 30s)
+    builtin: str | None = None       # answer in-process via a _BUILTINS handler instead of running a command
+
+    _check_command = field_validator("command")(_check_shell_words)
+
+    @field_validator("builtin")
+    @classmethod
+    def _check_builtin(cls, v: str | None) -> str | None:
+        if v is not None and v not in _BUILTINS:
+            raise ValueError(f"unknown builtin {v!r} (expected one of: {', '.join(sorted(_BUILTINS))})")
+        return v
 
 
 class CLImaxConfig(BaseModel):
     """Top-level configuration for a single CLI."""
+    model_config = ConfigDict(frozen=True)
+
     name: str = "climax"
     description: str = ""
     command: str                     # base command, e.g. "docker" or "/usr/bin/my-app"
@@ -106,13 +171,22 @@ class CLImaxConfig(BaseModel):
     global_args: list[ToolArg] = Field(default_factory=list)
     tools: list[ToolDef]
 
+    _check_command = field_validator("command")(_check_shell_words)
+
 
 # ---------------------------------------------------------------------------
 # Resolved tool: a ToolDef + the config it came from
 # ---------------------------------------------------------------------------
 
 class ResolvedTool(BaseModel):
-    """A tool definition paired with its parent CLI config."""
+    """A tool definition paired with its parent CLI config.
+
+    Everything derivable from the (immutable) tool definition — the JSON
+    input schema, the command prefix tokens, and the positional/flag split
+    of its arguments — is computed once here rather than on every request.
+    """
+    model_config = ConfigDict(frozen=True)
+
     tool: ToolDef
     base_command: str
     env: dict[str, str] = Field(default_factory=dict)
@@ -120,6 +194,28 @@ class ResolvedTool(BaseModel):
     global_args: list[ToolArg] = Field(default_factory=list)
     description_override: str | None = None
     arg_constraints: dict[str, "ArgConstraint"] = Field(default_factory=dict)
+    _input_schema: dict[str, Any] = {}
+    _command_prefix: tuple[str, ...] = ()
+    _positional_args: tuple[str, ...] = ()
+    _flag_args: tuple["_FlagSpec", ...] = ()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the per-tool artifacts used by list_tools and call_tool."""
+        self._input_schema = build_input_schema(self.tool.args)
+        self._command_prefix = _command_prefix(self.base_command, self.tool)
+        self._positional_args, self._flag_args = _partition_args(self.tool.args)
+
+    @property
+    def input_schema(self) -> dict[str, Any]:
+        """JSON Schema for the tool's arguments."""
+        return self._input_schema
+
+    def build_command(self, arguments: dict[str, Any]) -> list[str]:
+        """Build the subprocess command list for a call to this tool."""
+        return _assemble_command(
+            self._command_prefix, self._positional_args, self._flag_args,
+            arguments, self.global_args,
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -128,13 +224,33 @@ class ResolvedTool(BaseModel):
 
 class ArgConstraint(BaseModel):
     """Constraint on a single tool argument."""
+    model_config = ConfigDict(frozen=True)
+
     pattern: str | None = None     # regex (fullmatch) for string args
     min: float | None = None       # inclusive minimum for numeric args
     max: float | None = None       # inclusive maximum for numeric args
+    _compiled: re.Pattern[str] | None = None
+
+    @field_validator("pattern")
+    @classmethod
+    def _check_pattern(cls, value: str | None) -> str | None:
+        if value is not None:
+            try:
+                re.compile(value)
+            except re.error as e:
+                raise ValueError(f"invalid regex {value!r}: {e}") from None
+        return value
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compile the pattern once so per-call validation only matches."""
+        if self.pattern is not None:
+            self._compiled = re.compile(self.pattern)
 
 
 class ToolPolicy(BaseModel):
     """Per-tool policy: description override and arg constraints."""
+    model_config = ConfigDict(frozen=True)
+
     description: str | None = None
     args: dict[str, ArgConstraint] = Field(default_factory=dict)
 
@@ -146,15 +262,20 @@ class ExecutorType(str, Enum):
 
 class ExecutorConfig(BaseModel):
     """Execution environment configuration."""
+    model_config = ConfigDict(frozen=True)
+
     type: ExecutorType = ExecutorType.local
     image: str | None = None
     volumes: list[str] = Field(default_factory=list)
     working_dir: str | None = None
     network: str | None = None
+    reuse_container: bool = False    # keep one container running and `docker exec` into it
 
-    def model_post_init(self, __context: Any) -> None:
+    @model_validator(mode="after")
+    def _check_image(self) -> "ExecutorConfig":
         if self.type == ExecutorType.docker and not self.image:
             raise ValueError("Docker executor requires 'image' to be set")
+        return self
 
 
 class DefaultPolicy(str, Enum):
@@ -164,6 +285,8 @@ class DefaultPolicy(str, Enum):
 
 class PolicyConfig(BaseModel):
     """Top-level policy configuration."""
+    model_config = ConfigDict(frozen=True)
+
     executor: ExecutorConfig = Field(default_factory=ExecutorConfig)
     default: DefaultPolicy = DefaultPolicy.disabled
     tools: dict[str, ToolPolicy] = Field(default_factory=dict)
@@ -269,22 +392,23 @@ class ToolIndex:
                         extra={"markup": True},
                     )
 
+                resolved_tool = ResolvedTool(
+                    # model_dump() ensures compatibility when module is reloaded (e.g. in tests)
+                    tool=tool_def.model_dump(),
+                    base_command=config.command,
+                    env=dict(config.env),
+                    working_dir=config.working_dir,
+                )
                 entry = ToolIndexEntry(
                     tool_name=tool_def.name,
                     description=tool_def.description,
                     cli_name=config.name,
                     category=config.category,
                     tags=list(config.tags),
-                    input_schema=build_input_schema(tool_def.args),
+                    input_schema=resolved_tool.input_schema,
                 )
                 entries.append(entry)
-                resolved[tool_def.name] = ResolvedTool(
-                    # model_dump() ensures compatibility when module is reloaded (e.g. in tests)
-                    tool=tool_def.model_dump(),
-                    base_command=config.command,
-                    env=dict(config.env),
-                    working_dir=config.working_dir,
-                )
+                resolved[tool_def.name] = resolved_tool
 
         # Deduplicate entries: keep last occurrence of each tool name
         seen: set[str] = set()
@@ -376,11 +500,205 @@ def _resolve_config(name_or_path: str | Path) -> Path:
     return Path(s)
 
 
+# Parsed configs keyed by absolute path → (mtime_ns, size, config).
+# Entries are invalidated when the file's mtime or size changes.
+_CONFIG_CACHE_MAX = 100
+_config_cache: OrderedDict[str, tuple[int, int, CLImaxConfig]] = OrderedDict()
+_config_cache_lock = threading.Lock()
+
+
+def _cache_lookup(cache: OrderedDict[str, tuple[int, int, Any]], key: str, st: os.stat_result) -> Any:
+    """Return the cached value for key if the file is unchanged, else None."""
+    with _config_cache_lock:
+        cached = cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            cache.move_to_end(key)
+            return cached[2]
+    return None
+
+
+def _cache_store(
+    cache: OrderedDict[str, tuple[int, int, Any]], key: str, st: os.stat_result, value: Any,
+) -> None:
+    """Insert value for key, evicting the least recently used entries."""
+    with _config_cache_lock:
+        cache[key] = (st.st_mtime_ns, st.st_size, value)
+        cache.move_to_end(key)
+        while len(cache) > _CONFIG_CACHE_MAX:
+            cache.popitem(last=False)
+
+
+@functools.cache
+def _config_fingerprint() -> str:
+    """Identify the climax release and config schema that wrote a disk-cache entry.
+
+    Folded into cache keys so entries written by another climax version
+    (with different fields or validators) are never reused.
+    """
+    import importlib.metadata
+
+    try:
+        version = importlib.metadata.version("climax-mcp")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    schema = json.dumps(CLImaxConfig.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(f"{version}\0{schema}".encode()).hexdigest()
+
+
+def _disk_cache_path(key: str, st: os.stat_result) -> Path | None:
+    """Return the on-disk cache file for a config version, if caching is enabled.
+
+    Entries are named <path digest>-<version digest>.json, so all entries
+    for one config file share a prefix and stale ones can be pruned.
+    """
+    if not _config_cache_dir:
+        return None
+    path_digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    digest = hashlib.sha256(
+        f"{_config_fingerprint()}\0{key}\0{st.st_mtime_ns}\0{st.st_size}".encode()
+    ).hexdigest()
+    return Path(_config_cache_dir) / f"{path_digest}-{digest}.json"
+
+
+def _read_disk_cache(cache_path: Path | None) -> Any:
+    """Read a cache entry as JSON, or None on a miss or unreadable entry."""
+    if cache_path is None:
+        return None
+    try:
+        return json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_disk_cache(cache_path: Path | None, config: CLImaxConfig) -> None:
+    """Write a validated config to the on-disk cache (best effort).
+
+    Entries for earlier versions of the same config file (older edits or
+    another climax version) are removed, so the cache holds at most one
+    entry per config path.
+    """
+    if cache_path is None:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        entry = {"fingerprint": _config_fingerprint(), "config": config.model_dump(mode="json")}
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, cache_path)
+        path_digest = cache_path.name.split("-", 1)[0]
+        for stale in cache_path.parent.glob(f"{path_digest}-*.json"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Rebuild one field value from JSON according to its annotation."""
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin is list:
+        if not isinstance(value, list):
+            raise TypeError(f"expected a list, got {type(value).__name__}")
+        (item_type,) = get_args(annotation)
+        return [_construct_value(item_type, v) for v in value]
+    if origin is dict:
+        if not isinstance(value, dict):
+            raise TypeError(f"expected a mapping, got {type(value).__name__}")
+        _, value_type = get_args(annotation)
+        return {k: _construct_value(value_type, v) for k, v in value.items()}
+    if origin is Union or origin is UnionType:
+        for member in get_args(annotation):
+            if member is not NoneType:
+                return _construct_value(member, value)
+        return value
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _construct_model(annotation, value)
+        if issubclass(annotation, Enum):
+            return annotation(value)
+    return value
+
+
+def _construct_model(model_cls: type[BaseModel], data: dict[str, Any]) -> Any:
+    """Build model_cls from previously validated JSON data without re-validating.
+
+    Only safe for data produced by model_dump(mode="json") of a valid model,
+    such as the on-disk config cache. Raises TypeError when the data does not
+    have the model's shape.
+    """
+    if not isinstance(data, dict):
+        raise TypeError(f"expected a mapping for {model_cls.__name__}, got {type(data).__name__}")
+    values = {
+        name: _construct_value(field.annotation, data[name])
+        for name, field in model_cls.model_fields.items()
+        if name in data
+    }
+    return model_cls.model_construct(**values)
+
+
+def _config_from_cache_entry(entry: Any) -> CLImaxConfig | None:
+    """Rebuild a config from a disk-cache entry, or None if it cannot be trusted.
+
+    Entries written by this exact model definition are rebuilt without
+    re-validation; anything else (a different fingerprint, or data that
+    cannot be constructed) goes through full validation instead.
+    """
+    if not isinstance(entry, dict) or not isinstance(entry.get("config"), dict):
+        return None
+    data = entry["config"]
+    if entry.get("fingerprint") == _config_fingerprint():
+        try:
+            return _construct_model(CLImaxConfig, data)
+        except Exception as e:
+            logger.debug("Could not rebuild cached config: %s", e)
+    try:
+        return CLImaxConfig(**data)
+    except (ValidationError, TypeError):
+        return None
+
+
 def load_config(path: str | Path) -> CLImaxConfig:
-    """Load and validate a YAML config file."""
-    raw = _resolve_config(path).read_text()
-    data = yaml.safe_load(raw)
-    return CLImaxConfig(**data)
+    """Load and validate a YAML config file.
+
+    Results are cached per file and reused until its mtime or size changes,
+    so repeated loads of an unchanged config skip YAML parsing and validation.
+    When CLIMAX_CACHE_DIR is set, parsed configs are also stored there as
+    JSON so later processes can skip YAML parsing.
+    """
+    config_path = _resolve_config(path)
+    st = config_path.stat()
+    key = os.path.abspath(config_path)
+
+    cached = _cache_lookup(_config_cache, key, st)
+    if cached is not None:
+        return cached
+
+    cache_path = _disk_cache_path(key, st)
+    config = _config_from_cache_entry(_read_disk_cache(cache_path))
+    if config is None:
+        raw = config_path.read_bytes()
+        data = yaml.load(raw, Loader=_YamlLoader)
+        config = CLImaxConfig(**data)
+        _write_disk_cache(cache_path, config)
+
+    _cache_store(_config_cache, key, st, config)
+    return config
+
+
+_LOAD_WORKERS = 8
+
+
+def _map_paths(func: Callable[[Any], Any], paths: list[Any]) -> list[Any]:
+    """Apply func to each path, overlapping file I/O across a small thread pool.
+
+    Results come back in input order; with a single path no pool is used.
+    """
+    if len(paths) <= 1:
+        return [func(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(paths))) as pool:
+        return list(pool.map(func, paths))
 
 
 def load_configs(paths: list[str | Path]) -> tuple[str, dict[str, ResolvedTool], list[CLImaxConfig]]:
@@ -395,8 +713,9 @@ def load_configs(paths: list[str | Path]) -> tuple[str, dict[str, ResolvedTool],
     names: list[str] = []
     configs: list[CLImaxConfig] = []
 
-    for path in paths:
-        config = load_config(path)
+    # Files are read in parallel; merging stays sequential so duplicate
+    # handling and log order match the order the configs were given in.
+    for path, config in zip(paths, _map_paths(load_config, list(paths))):
         configs.append(config)
         names.append(config.name)
         logger.info(
@@ -412,12 +731,16 @@ def load_configs(paths: list[str | Path]) -> tuple[str, dict[str, ResolvedTool],
                     tool_def.name, path,
                     extra={"markup": True},
                 )
-            tool_map[tool_def.name] = ResolvedTool(
+            # Inputs come from an already-validated config, so skip re-validation.
+            # Interned keys let call_tool lookups hit the identity fast path.
+            tool_map[sys.intern(tool_def.name)] = ResolvedTool.model_construct(
                 tool=tool_def,
                 base_command=config.command,
                 env=config.env,
                 working_dir=config.working_dir,
                 global_args=config.global_args,
+                description_override=None,
+                arg_constraints={},
             )
 
     # Server name: use the single config name, or combine them
@@ -436,11 +759,28 @@ def load_configs(paths: list[str | Path]) -> tuple[str, dict[str, ResolvedTool],
 # Policy loading and application
 # ---------------------------------------------------------------------------
 
+# Parsed policies, cached the same way as configs
+_policy_cache: OrderedDict[str, tuple[int, int, PolicyConfig]] = OrderedDict()
+
+
 def load_policy(path: str | Path) -> PolicyConfig:
-    """Load and validate a policy YAML file."""
-    raw = Path(path).read_text()
-    data = yaml.safe_load(raw)
-    return PolicyConfig(**data)
+    """Load and validate a policy YAML file.
+
+    Like load_config, results are reused until the file's mtime or size changes.
+    """
+    policy_path = Path(path)
+    st = policy_path.stat()
+    key = os.path.abspath(policy_path)
+
+    cached = _cache_lookup(_policy_cache, key, st)
+    if cached is not None:
+        return cached
+
+    raw = policy_path.read_bytes()
+    data = yaml.load(raw, Loader=_YamlLoader)
+    policy = PolicyConfig(**data)
+    _cache_store(_policy_cache, key, st, policy)
+    return policy
 
 
 def apply_policy(
@@ -473,11 +813,11 @@ def apply_policy(
         # default=enabled: all tools survive
 
         # Clone the resolved tool with overrides
-        new_resolved = resolved.model_copy()
+        overrides: dict[str, Any] = {}
 
         if tool_policy is not None:
             if tool_policy.description is not None:
-                new_resolved.description_override = tool_policy.description
+                overrides["description_override"] = tool_policy.description
             if tool_policy.args:
                 # Warn about unknown arg names
                 known_args = {a.name for a in resolved.tool.args}
@@ -489,12 +829,12 @@ def apply_policy(
                             name, arg_name,
                             extra={"markup": True},
                         )
-                new_resolved.arg_constraints = {
+                overrides["arg_constraints"] = {
                     k: v for k, v in tool_policy.args.items()
                     if k in known_args
                 }
 
-        result[name] = new_resolved
+        result[name] = resolved.model_copy(update=overrides)
 
     return result
 
@@ -509,42 +849,45 @@ def validate_arguments(
 
     Returns a list of error messages (empty = valid).
     """
+    if not constraints or not arguments:
+        return []
+
     errors: list[str] = []
+    get = arguments.get
 
     for arg_name, constraint in constraints.items():
-        if arg_name not in arguments:
+        value = get(arg_name, _MISSING)
+        if value is _MISSING:
             continue
 
-        value = arguments[arg_name]
-
-        if constraint.pattern is not None and isinstance(value, str):
-            if not re.fullmatch(constraint.pattern, value):
+        compiled = constraint._compiled
+        if compiled is not None and isinstance(value, str):
+            if not compiled.fullmatch(value):
                 errors.append(
                     f"Argument '{arg_name}': value '{value}' does not match "
                     f"pattern '{constraint.pattern}'"
                 )
 
-        if constraint.min is not None:
-            try:
-                num = float(value)
-                if num < constraint.min:
-                    errors.append(
-                        f"Argument '{arg_name}': value {value} is below "
-                        f"minimum {constraint.min}"
-                    )
-            except (TypeError, ValueError):
-                pass
+        lo = constraint.min
+        hi = constraint.max
+        if lo is None and hi is None:
+            continue
+        try:
+            num = float(value)
+        except (TypeError, ValueError):
+            continue
 
-        if constraint.max is not None:
-            try:
-                num = float(value)
-                if num > constraint.max:
-                    errors.append(
-                        f"Argument '{arg_name}': value {value} exceeds "
-                        f"maximum {constraint.max}"
-                    )
-            except (TypeError, ValueError):
-                pass
+        if lo is not None and num < lo:
+            errors.append(
+                f"Argument '{arg_name}': value {value} is below "
+                f"minimum {lo}"
+            )
+
+        if hi is not None and num > hi:
+            errors.append(
+                f"Argument '{arg_name}': value {value} exceeds "
+                f"maximum {hi}"
+            )
 
     return errors
 
@@ -627,24 +970,155 @@ def validate_tool_args(
     return coerced, errors
 
 
-def build_docker_prefix(executor: ExecutorConfig) -> list[str]:
-    """Build a docker run prefix command list from executor config."""
-    cmd = ["docker", "run", "--rm"]
+def _docker_run_options(executor: ExecutorConfig) -> list[str]:
+    """Volume, network and working-directory flags for `docker run`."""
+    opts: list[str] = []
 
     for vol in executor.volumes:
-        cmd.extend(["-v", os.path.expandvars(vol)])
+        opts.extend(["-v", os.path.expandvars(vol)])
 
     if executor.network:
-        cmd.extend(["--network", executor.network])
+        opts.extend(["--network", executor.network])
 
     if executor.working_dir:
-        cmd.extend(["-w", executor.working_dir])
+        opts.extend(["-w", executor.working_dir])
 
+    return opts
+
+
+def build_docker_prefix(executor: ExecutorConfig) -> list[str]:
+    """Build a docker run prefix command list from executor config."""
+    cmd = ["docker", "run", "--rm", *_docker_run_options(executor)]
     cmd.append(executor.image)  # type: ignore[arg-type]
+    return cmd
+
 
+def build_docker_exec_prefix(
+    executor: ExecutorConfig,
+    container: str,
+    env: Mapping[str, str] | None = None,
+) -> list[str]:
+    """Build a docker exec prefix command list for a running container."""
+    cmd = ["docker", "exec"]
+    if executor.working_dir:
+        cmd.extend(["-w", executor.working_dir])
+    for key, value in (env or {}).items():
+        cmd.extend(["-e", f"{key}={value}"])
+    cmd.append(container)
     return cmd
 
 
+# Environment marker set on each `docker exec` into a reused container, so the
+# processes of a timed-out call can be found and killed inside the container
+_CALL_ID_VAR = "CLIMAX_CALL_ID"
+
+
+# How `docker exec` reports a container that has exited or been removed
+_CONTAINER_GONE_RE = re.compile(
+    r"Error response from daemon: (?:No such container|[Cc]ontainer \S+ is not running)"
+)
+
+
+class DockerContainer:
+    """A long-lived executor container that tool calls `docker exec` into.
+
+    Used when the executor sets ``reuse_container``: the container is started
+    on the first tool call (with its entrypoint replaced by ``sleep infinity``,
+    so the image must provide ``sleep``) and removed when the server process
+    exits, so each call skips container creation and start-up. If the
+    container goes away it is started again on the next call.
+    """
+
+    def __init__(self, executor: ExecutorConfig) -> None:
+        self.executor = executor
+        self.name = f"climax-exec-{uuid.uuid4().hex[:12]}"
+        self._started = False
+        self._registered = False
+        self._lock = asyncio.Lock()
+
+    async def exec_prefix(self, call_id: str | None = None) -> list[str]:
+        """Return the docker exec prefix, starting the container if needed.
+
+        With call_id, the exec'd process (and everything it spawns) carries
+        it in CLIMAX_CALL_ID so kill_call() can find it later. Raises
+        RuntimeError if the container cannot be started.
+        """
+        async with self._lock:
+            if not self._started:
+                cmd = [
+                    "docker", "run", "-d", "--rm", "--name", self.name,
+                    *_docker_run_options(self.executor),
+                    "--entrypoint", "sleep",
+                    self.executor.image,  # type: ignore[list-item]
+                    "infinity",
+                ]
+                returncode, _, stderr = await run_command(cmd, timeout=120.0)
+                if returncode != 0:
+                    raise RuntimeError(f"Failed to start executor container: {stderr.strip()}")
+                self._started = True
+                if not self._registered:
+                    atexit.register(self.remove)
+                    self._registered = True
+                logger.info("Started executor container %s", self.name)
+        env = {_CALL_ID_VAR: call_id} if call_id else None
+        return build_docker_exec_prefix(self.executor, self.name, env)
+
+    async def discard_if_gone(self, name: str, stderr: str) -> bool:
+        """Forget container name if a failed exec says it no longer runs.
+
+        A reused container can exit, be OOM-killed or be removed with
+        `docker rm -f`; the exec then fails before the tool starts. Returns
+        True when stderr shows that, after which exec_prefix() starts a new
+        container under a fresh name. Concurrent calls that failed against
+        the same container only trigger one restart.
+        """
+        if not _CONTAINER_GONE_RE.match(stderr.lstrip()):
+            return False
+        async with self._lock:
+            if name == self.name and self._started:
+                logger.warning("Executor container %s is gone; starting a new one", name)
+                # Clear out an exited container that --rm has not removed yet
+                await run_command(["docker", "rm", "-f", name], timeout=30.0)
+                self.name = f"climax-exec-{uuid.uuid4().hex[:12]}"
+                self._started = False
+        return True
+
+    async def kill_call(self, call_id: str) -> None:
+        """Kill whatever a timed-out call left running inside the container.
+
+        Stopping the local `docker exec` client does not stop the process in
+        the container, so processes are matched by their CLIMAX_CALL_ID
+        marker and killed with a small `sh` script. Best effort: in images
+        without `sh` the orphaned work runs until the container is removed.
+        """
+        script = (
+            "for e in /proc/[0-9]*/environ; do "
+            f"tr '\\0' '\\n' 2>/dev/null < \"$e\" | grep -qx '{_CALL_ID_VAR}={call_id}' "
+            "&& { p=${e%/environ}; kill -9 \"${p##*/}\" 2>/dev/null; }; "
+            "done; true"
+        )
+        returncode, _, stderr = await run_command(
+            ["docker", "exec", self.name, "sh", "-c", script], timeout=10.0,
+        )
+        if returncode != 0:
+            logger.warning(
+                "Could not stop timed-out call in container %s: %s", self.name, stderr.strip(),
+            )
+
+    def remove(self) -> None:
+        """Force-remove the container (registered with atexit once started)."""
+        if not self._started:
+            return
+        try:
+            subprocess.run(
+                ["docker", "rm", "-f", self.name],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
+            )
+        except OSError:
+            pass
+        self._started = False
+
+
 # ---------------------------------------------------------------------------
 # Config → JSON Schema (for MCP tool input schemas)
 # ---------------------------------------------------------------------------
@@ -656,6 +1130,9 @@ TYPE_MAP = {
     ArgType.boolean: "boolean",
 }
 
+# Prebuilt {"type": ...} property dicts; build_input_schema copies these
+_BASE_PROP: dict[ArgType, dict[str, Any]] = {t: {"type": v} for t, v in TYPE_MAP.items()}
+
 
 def build_input_schema(args: list[ToolArg]) -> dict:
     """Convert a list of ToolArg into a JSON Schema object."""
@@ -663,9 +1140,7 @@ def build_input_schema(args: list[ToolArg]) -> dict:
     required: list[str] = []
 
     for arg in args:
-        prop: dict[str, Any] = {
-            "type": TYPE_MAP[arg.type],
-        }
+        prop = _BASE_PROP[arg.type].copy()
         if arg.description:
             prop["description"] = arg.description
         if arg.default is not None:
@@ -692,61 +1167,105 @@ def build_input_schema(args: list[ToolArg]) -> dict:
 # Arguments → CLI command list
 # ---------------------------------------------------------------------------
 
-def build_command(
-    base_cmd: str,
-    tool_def: ToolDef,
-    arguments: dict[str, Any],
-    global_args: list[ToolArg] | None = None,
-) -> list[str]:
-    """
-    Build a subprocess-safe command list from the base command,
-    tool subcommand, and provided arguments.
-    """
-    # Start with base command (split to handle e.g. "python -m myapp")
-    # Expand ~ and $HOME so configs can use portable paths
-    cmd = os.path.expandvars(os.path.expanduser(base_cmd)).split()
+# Sentinel for "argument not provided" (None is a legitimate lookup result)
+_MISSING = object()
 
-    # Add subcommand parts
-    if tool_def.command:
-        cmd.extend(tool_def.command.split())
 
-    # First pass: positional args (in definition order)
-    for arg_def in tool_def.args:
+def _flag_for(arg: ToolArg) -> str:
+    """Return the flag for an argument, auto-generated from its name if unset."""
+    return arg.flag or f"--{arg.name.replace('_', '-')}"
+
+
+# A base-command token that is nothing but a variable reference, e.g. $CMD
+_BARE_VAR_RE = re.compile(r"\$(\w+|\{\w+\})")
+
+
+def _expand_token(token: str) -> list[str]:
+    """Expand ~ and $VARs in one base-command token."""
+    expanded = os.path.expandvars(os.path.expanduser(token))
+    # A bare $VAR may hold a whole command ("python -m myapp"), so its value
+    # is split on whitespace; any other token stays a single argument
+    if _BARE_VAR_RE.fullmatch(token):
+        return expanded.split()
+    return [expanded]
+
+
+def _command_prefix(base_cmd: str, tool_def: ToolDef | None = None) -> tuple[str, ...]:
+    """Split the base command and tool subcommand into argv tokens."""
+    # shlex handles e.g. "python -m myapp" as well as quoted paths with spaces;
+    # it runs on the raw string so expanded values are never re-parsed
+    base_tokens = [t for token in shlex.split(base_cmd) for t in _expand_token(token)]
+    sub_tokens = shlex.split(tool_def.command) if tool_def and tool_def.command else ()
+    return (*base_tokens, *sub_tokens)
+
+
+# (name, resolved flag, is_bool, is_inline, default) for a non-positional arg
+_FlagSpec = tuple[str, str, bool, bool, Any]
+
+
+def _partition_args(
+    args: list[ToolArg],
+) -> tuple[tuple[str, ...], tuple[_FlagSpec, ...]]:
+    """Split args into positional arg names and flag descriptors.
+
+    cwd and stdin args are excluded — they never appear on the command line.
+    """
+    positional: list[str] = []
+    flags: list[_FlagSpec] = []
+    for arg_def in args:
         if arg_def.cwd or arg_def.stdin:
             continue
-        if arg_def.positional and arg_def.name in arguments:
-            cmd.append(str(arguments[arg_def.name]))
+        if arg_def.positional:
+            positional.append(arg_def.name)
+        else:
+            flag = _flag_for(arg_def)
+            flags.append((
+                arg_def.name, flag, arg_def.type == ArgType.boolean,
+                flag.endswith("="), arg_def.default,
+            ))
+    return tuple(positional), tuple(flags)
+
+
+def _assemble_command(
+    prefix: tuple[str, ...],
+    positional_args: tuple[str, ...],
+    flag_args: tuple[_FlagSpec, ...],
+    arguments: dict[str, Any],
+    global_args: list[ToolArg] | None,
+) -> list[str]:
+    """Append argument values to a precomputed command prefix."""
+    cmd = [*prefix]
+    append = cmd.append
+    get = arguments.get
 
-    # Second pass: flag args
-    for arg_def in tool_def.args:
-        if arg_def.positional or arg_def.cwd or arg_def.stdin:
-            continue
+    # Positional args first (in definition order)
+    for name in positional_args:
+        value = get(name, _MISSING)
+        if value is not _MISSING:
+            append(str(value))
 
-        value = arguments.get(arg_def.name)
+    # Then flag args
+    for name, flag, is_bool, is_inline, default in flag_args:
+        value = get(name)
 
         # If not provided and has a default, use it
-        if value is None and arg_def.default is not None:
-            value = arg_def.default
         if value is None:
-            continue
-
-        flag = arg_def.flag
-        if not flag:
-            # Auto-generate flag from name
-            flag = f"--{arg_def.name.replace('_', '-')}"
+            value = default
+            if value is None:
+                continue
 
-        if arg_def.type == ArgType.boolean:
+        if is_bool:
             # Boolean: include flag if True, omit if False
             if value is True or value == "true":
-                cmd.append(flag)
-        elif flag.endswith("="):
+                append(flag)
+        elif is_inline:
             # Inline flag: concatenate flag and value as one token (e.g. "file=myfile")
-            cmd.append(f"{flag}{value}")
+            append(f"{flag}{value}")
         else:
-            cmd.append(flag)
-            cmd.append(str(value))
+            append(flag)
+            append(str(value))
 
-    # Third pass: global args (config-level args appended to every tool)
+    # Global args (config-level args appended to every tool)
     for ga in global_args or []:
         if ga.default is None:
             continue
@@ -758,9 +1277,7 @@ def build_command(
         if not resolved_val:
             continue
 
-        flag = ga.flag
-        if not flag:
-            flag = f"--{ga.name.replace('_', '-')}"
+        flag = _flag_for(ga)
 
         if ga.type == ArgType.boolean:
             if resolved_val in ("true", "True", "1"):
@@ -774,10 +1291,176 @@ def build_command(
     return cmd
 
 
+def build_command(
+    base_cmd: str,
+    tool_def: ToolDef,
+    arguments: dict[str, Any],
+    global_args: list[ToolArg] | None = None,
+) -> list[str]:
+    """
+    Build a subprocess-safe command list from the base command,
+    tool subcommand, and provided arguments.
+    """
+    positional_args, flag_args = _partition_args(tool_def.args)
+    return _assemble_command(
+        _command_prefix(base_cmd, tool_def), positional_args, flag_args,
+        arguments, global_args,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Execute CLI command
 # ---------------------------------------------------------------------------
 
+# Snapshot of the server's environment, taken once at import. Every spawn
+# gets an explicit environment: this snapshot as is, or, for a tool with env
+# overrides, the snapshot merged with them (built once per distinct set and
+# reused). Changes to os.environ after import are seen by no tool.
+_BASE_ENV: Mapping[str, str] = MappingProxyType(dict(os.environ))
+_merged_env_cache: dict[frozenset[tuple[str, str]], Mapping[str, str]] = {}
+
+
+def _merged_env(env: dict[str, str] | None) -> Mapping[str, str]:
+    """Return the base environment snapshot overlaid with env."""
+    if not env:
+        return _BASE_ENV
+    key = frozenset(env.items())
+    merged = _merged_env_cache.get(key)
+    if merged is None:
+        merged = MappingProxyType({**_BASE_ENV, **env})
+        _merged_env_cache[key] = merged
+    return merged
+
+
+# Subprocess output is read in fixed-size chunks and capped per stream so
+# a runaway CLI (e.g. `docker logs`) cannot exhaust server memory. The cap
+# can be changed with CLIMAX_MAX_OUTPUT_BYTES.
+_READ_CHUNK_SIZE = 64 * 1024
+_DEFAULT_MAX_OUTPUT_BYTES = 16 * 1024 * 1024
+
+
+def _max_output_bytes_from_env(environ: Mapping[str, str]) -> int:
+    """Return the per-stream output cap, honouring CLIMAX_MAX_OUTPUT_BYTES."""
+    value = environ.get("CLIMAX_MAX_OUTPUT_BYTES")
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning("Ignoring invalid CLIMAX_MAX_OUTPUT_BYTES=%r", value)
+    return _DEFAULT_MAX_OUTPUT_BYTES
+
+
+MAX_OUTPUT_BYTES = _max_output_bytes_from_env(os.environ)
+
+
+def _decode_output(data: bytes | bytearray) -> str:
+    """Decode subprocess output as UTF-8, replacing undecodable bytes."""
+    # bytes.decode("utf-8") hits CPython's built-in UTF-8 fast path; empty
+    # streams (the common case for stderr) skip the call altogether.
+    return data.decode("utf-8", "replace") if data else ""
+
+
+def _truncated_output(data: bytes | bytearray, limit: int) -> str:
+    """Decode capped output and append a marker saying it was cut short."""
+    return f"{_decode_output(data)}\n[output truncated at {limit} bytes]"
+
+
+async def _read_capped(
+    stream: asyncio.StreamReader,
+    buf: bytearray,
+    limit: int,
+) -> bool:
+    """Read a pipe to EOF in chunks, keeping at most ``limit`` bytes in ``buf``.
+
+    Output beyond the limit is drained and discarded so the child never
+    blocks on a full pipe. Returns True if anything was discarded.
+    """
+    truncated = False
+    while chunk := await stream.read(_READ_CHUNK_SIZE):
+        room = limit - len(buf)
+        if len(chunk) > room:
+            truncated = True
+            if room > 0:
+                buf += chunk[:room]
+        else:
+            buf += chunk
+    return truncated
+
+
+async def _feed_stdin(stdin: asyncio.StreamWriter, data: bytes) -> None:
+    """Write data to the child's stdin and close it."""
+    try:
+        stdin.write(data)
+        await stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # Child exited without reading all of its input
+        pass
+    finally:
+        stdin.close()
+
+
+# Executable name → absolute path, so repeated spawns skip the PATH search
+_which_cache: dict[str, str] = {}
+
+
+def _resolve_executable(name: str, env: Mapping[str, str] | None) -> str:
+    """Return the absolute path of an executable found on PATH, cached.
+
+    The lookup uses the PATH of the _BASE_ENV snapshot, which is what the
+    child runs with. Names containing a path separator, names not found on
+    PATH and commands run with a PATH override are returned unchanged.
+    """
+    if os.sep in name or (env and "PATH" in env):
+        return name
+    path = _which_cache.get(name)
+    if path is None:
+        path = shutil.which(name, path=_BASE_ENV.get("PATH", os.defpath))
+        if path is None or not os.path.isabs(path):
+            return name
+        _which_cache[name] = path
+    return path
+
+
+# On POSIX each tool runs in its own session, so a timeout can kill the whole
+# process group — including grandchildren of shell wrappers or `docker run`.
+_NEW_SESSION = hasattr(os, "killpg")
+
+
+# Seconds a timed-out tool gets to exit after SIGTERM before it is killed
+_KILL_GRACE = 2.0
+
+
+def _signal_process_group(proc: asyncio.subprocess.Process, force: bool) -> None:
+    """Terminate (or, with force, kill) a child and everything it spawned."""
+    if _NEW_SESSION:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+            return
+        except ProcessLookupError:
+            return  # already exited
+        except PermissionError:
+            pass
+    if proc.returncode is not None:
+        return
+    try:
+        proc.kill() if force else proc.terminate()
+    except ProcessLookupError:
+        pass
+
+
+async def _stop_process(proc: asyncio.subprocess.Process) -> None:
+    """Stop a timed-out child gracefully, escalating to SIGKILL, and reap it."""
+    _signal_process_group(proc, force=False)
+    try:
+        async with asyncio.timeout(_KILL_GRACE):
+            await proc.wait()
+    except TimeoutError:
+        pass
+    # Also catches grandchildren that ignored SIGTERM or outlived the leader
+    _signal_process_group(proc, force=True)
+    await proc.wait()
+
+
 async def run_command(
     cmd: list[str],
     env: dict[str, str] | None = None,
@@ -785,39 +1468,67 @@ async def run_command(
     timeout: float = 30.0,
     stdin_data: str | None = None,
 ) -> tuple[int, str, str]:
-    """Run a command asynchronously and return (returncode, stdout, stderr)."""
-    full_env = os.environ.copy()
-    if env:
-        full_env.update(env)
+    """Run a command asynchronously and return (returncode, stdout, stderr).
+
+    stdout and stderr are read incrementally and each capped at
+    MAX_OUTPUT_BYTES; a capped stream ends with a truncation marker. On
+    timeout the process is sent SIGTERM, killed if it has not exited after
+    _KILL_GRACE seconds, and reaped; whatever output was captured so far is
+    returned alongside the timeout message.
+    """
+    full_env = _merged_env(env)
+    stdout_buf = bytearray()
+    stderr_buf = bytearray()
 
     try:
         logger.debug("Spawning: %s (cwd=%s)", cmd[0], working_dir or "<inherited>")
         proc = await asyncio.create_subprocess_exec(
             *cmd,
+            executable=_resolve_executable(cmd[0], env),
             stdin=asyncio.subprocess.PIPE if stdin_data else asyncio.subprocess.DEVNULL,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             env=full_env,
             cwd=working_dir,
+            start_new_session=_NEW_SESSION,
         )
         logger.debug("Process started (pid=%s)", proc.pid)
-        stdout, stderr = await asyncio.wait_for(
-            proc.communicate(input=stdin_data.encode("utf-8") if stdin_data else None),
-            timeout=timeout,
-        )
+
+        readers = [
+            _read_capped(proc.stdout, stdout_buf, MAX_OUTPUT_BYTES),
+            _read_capped(proc.stderr, stderr_buf, MAX_OUTPUT_BYTES),
+        ]
+        if stdin_data:
+            readers.append(_feed_stdin(proc.stdin, stdin_data.encode("utf-8")))
+        async with asyncio.timeout(timeout):
+            out_truncated, err_truncated, *_ = await asyncio.gather(*readers)
+            await proc.wait()
+        if out_truncated or err_truncated:
+            logger.warning(
+                "Output of %s exceeded %d bytes — truncated",
+                cmd[0], MAX_OUTPUT_BYTES,
+            )
         return (
             proc.returncode or 0,
-            stdout.decode("utf-8", errors="replace"),
-            stderr.decode("utf-8", errors="replace"),
+            _truncated_output(stdout_buf, MAX_OUTPUT_BYTES) if out_truncated else _decode_output(stdout_buf),
+            _truncated_output(stderr_buf, MAX_OUTPUT_BYTES) if err_truncated else _decode_output(stderr_buf),
         )
-    except asyncio.TimeoutError:
+    except TimeoutError:
         logger.warning(
-            "⏱ Timeout after %.1fs (pid=%s, cmd=%s) — killing process",
+            "⏱ Timeout after %.1fs (pid=%s, cmd=%s) — stopping process",
             timeout, getattr(proc, 'pid', '?'), cmd[0],
         )
-        proc.kill()  # type: ignore
-        return (-1, "", f"Command timed out after {timeout}s")
+        await _stop_process(proc)  # type: ignore[arg-type]
+        partial_err = _decode_output(stderr_buf).rstrip()
+        message = f"Command timed out after {timeout}s"
+        return (
+            -1,
+            _decode_output(stdout_buf),
+            f"{partial_err}\n{message}" if partial_err else message,
+        )
     except FileNotFoundError:
+        # The cached path may be stale (binary moved or uninstalled)
+        _which_cache.pop(cmd[0], None)
         logger.error("Command not found: %s", cmd[0])
         return (-1, "", f"Command not found: {cmd[0]}")
 
@@ -832,11 +1543,25 @@ def create_server(
     executor: ExecutorConfig | None = None,
     index: "ToolIndex | None" = None,
     classic: bool = False,
-) -> Server:
-    """Create and configure the MCP server from resolved tools."""
+    batch: bool = False,
+) -> "Server":
+    """Create and configure the MCP server from resolved tools.
+
+    With batch=True a climax_batch meta-tool is also registered, letting a
+    client run several tool calls in one request.
+    """
+    import mcp.types as types
+    from mcp.server.lowlevel import Server
 
     server = Server(server_name)
 
+    # Persistent executor container, started lazily on the first tool call
+    _container = (
+        DockerContainer(executor)
+        if executor and executor.type == ExecutorType.docker and executor.reuse_container
+        else None
+    )
+
     # Meta-tool definitions for default (progressive discovery) mode
     _META_TOOLS = [
         types.Tool(
@@ -885,34 +1610,75 @@ def create_server(
         ),
     ]
 
+    # Bounds on one climax_batch request, so it cannot spawn without limit
+    _BATCH_MAX_CALLS = 64
+    _BATCH_MAX_CONCURRENT = 16
+
+    _BATCH_TOOL = types.Tool(
+        name="climax_batch",
+        description="Execute several CLI tools in one request. Independent calls run concurrently; results are returned in call order.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": f"Tool calls to execute, each with a tool_name and optional args (at most {_BATCH_MAX_CALLS})",
+                    "maxItems": _BATCH_MAX_CALLS,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool_name": {"type": "string"},
+                            "args": {"type": "object"},
+                        },
+                        "required": ["tool_name"],
+                    },
+                },
+                "max_concurrent": {
+                    "type": "integer",
+                    "description": f"Maximum number of calls running at once (default: 4, capped at {_BATCH_MAX_CONCURRENT})",
+                    "default": 4,
+                },
+                "stop_on_error": {
+                    "type": "boolean",
+                    "description": "Skip calls that have not started yet once any call fails (default: false)",
+                    "default": False,
+                },
+            },
+            "required": ["calls"],
+        },
+    )
+    if batch:
+        _META_TOOLS.append(_BATCH_TOOL)
+
+    # Classic mode tool list: tools are fixed once the server is created,
+    # so build the response once instead of on every list_tools request.
+    _CLASSIC_TOOLS = [
+        types.Tool(
+            name=resolved.tool.name,
+            description=resolved.description_override or resolved.tool.description,
+            inputSchema=resolved.input_schema,
+        )
+        for resolved in tool_map.values()
+    ] if classic or index is None else []
+    if batch and (classic or index is None):
+        _CLASSIC_TOOLS.append(_BATCH_TOOL)
+
     @server.list_tools()
     async def list_tools() -> list[types.Tool]:
         """Return tools based on mode: meta-tools (default) or all individual tools (classic)."""
         if not classic and index is not None:
-            return list(_META_TOOLS)
-
-        # Classic mode: return all individual tools
-        result = []
-        for name, resolved in tool_map.items():
-            td = resolved.tool
-            description = resolved.description_override or td.description
-            result.append(
-                types.Tool(
-                    name=td.name,
-                    description=description,
-                    inputSchema=build_input_schema(td.args),
-                )
-            )
-        return result
+            return _META_TOOLS
+        return _CLASSIC_TOOLS
 
-    async def _execute_tool(
+    async def _run_tool(
         resolved: ResolvedTool,
         arguments: dict[str, Any],
         executor_cfg: ExecutorConfig | None = executor,
-    ) -> list[types.TextContent]:
+    ) -> tuple[bool, str]:
         """Execute a resolved tool with validated arguments.
 
-        Shared by both classic call_tool and climax_call meta-tool.
+        Returns (ok, response text); ok is False when policy validation
+        rejects the call or the command exits non-zero.
         """
         # Validate arguments against policy constraints
         if resolved.arg_constraints:
@@ -920,16 +1686,7 @@ def create_server(
             if errors:
                 error_text = "Policy validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
                 logger.warning("Policy rejected %s: %s", resolved.tool.name, "; ".join(errors))
-                return [types.TextContent(type="text", text=error_text)]
-
-        cmd = build_command(resolved.base_command, resolved.tool, arguments, global_args=resolved.global_args)
-
-        # Extract stdin arg value if present
-        stdin_data = None
-        for arg_def in resolved.tool.args:
-            if arg_def.stdin and arg_def.name in arguments:
-                stdin_data = str(arguments[arg_def.name])
-                break
+                return False, error_text
 
         # Extract cwd arg value if present
         working_dir = resolved.working_dir
@@ -938,35 +1695,70 @@ def create_server(
                 working_dir = arguments[arg_def.name]
                 break
 
-        # Prepend docker prefix if executor is docker type
-        if executor_cfg and executor_cfg.type == ExecutorType.docker:
-            cmd = build_docker_prefix(executor_cfg) + cmd
-
-        cmd_str = " ".join(cmd)
-
-        # Build a display-friendly version that truncates large values
-        display_parts = []
-        for token in cmd:
-            if len(token) > 120:
-                display_parts.append(f"{token[:60]}…[{len(token)} bytes]")
-            else:
-                display_parts.append(token)
-        cmd_display = " ".join(display_parts)
-
-        logger.info("▶ %s", cmd_display)
-        logger.debug("▶ full command: %s", cmd_str)
         t0 = time.monotonic()
-
-        tool_timeout = resolved.tool.timeout or 30.0
-        returncode, stdout, stderr = await run_command(
-            cmd,
-            env=resolved.env or None,
-            working_dir=working_dir,
-            timeout=tool_timeout,
-            stdin_data=stdin_data,
-        )
+        builtin = resolved.tool.builtin
+        if builtin is not None:
+            # Handled in-process: no argv, no executor prefix, no subprocess
+            logger.info("▶ builtin:%s", builtin)
+            returncode, stdout, stderr = _BUILTINS[builtin](arguments, working_dir)
+        else:
+            tool_cmd = resolved.build_command(arguments)
+
+            call_id = None  # set when exec'ing into a reused container
+            # Extract stdin arg value if present
+            stdin_data = None
+            for arg_def in resolved.tool.args:
+                if arg_def.stdin and arg_def.name in arguments:
+                    stdin_data = str(arguments[arg_def.name])
+                    break
+
+            # A reused container that has gone away is restarted once per call
+            for attempt in range(2):
+                cmd = tool_cmd
+                # Prepend docker prefix if executor is docker type
+                if executor_cfg and executor_cfg.type == ExecutorType.docker:
+                    if _container is not None:
+                        call_id = call_id or uuid.uuid4().hex
+                        try:
+                            cmd = await _container.exec_prefix(call_id) + cmd
+                        except RuntimeError as e:
+                            logger.error("%s", e)
+                            return False, str(e)
+                        container_name = _container.name
+                    else:
+                        cmd = build_docker_prefix(executor_cfg) + cmd
+
+                # Only pay for joining argv when the record will actually be emitted
+                if logger.isEnabledFor(logging.INFO):
+                    # Display-friendly version that truncates large values
+                    logger.info("▶ %s", " ".join(
+                        f"{t[:60]}…[{len(t)} bytes]" if len(t) > 120 else t for t in cmd
+                    ))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("▶ full command: %s", " ".join(cmd))
+                tool_timeout = resolved.tool.timeout or 30.0
+                returncode, stdout, stderr = await run_command(
+                    cmd,
+                    env=resolved.env or None,
+                    working_dir=working_dir,
+                    timeout=tool_timeout,
+                    stdin_data=stdin_data,
+                )
+                if call_id is None:
+                    break
+                if returncode == -1:
+                    # run_command stopped only the local docker exec client
+                    await _container.kill_call(call_id)  # type: ignore[union-attr]
+                    break
+                if returncode == 0 or attempt:
+                    break
+                if not await _container.discard_if_gone(container_name, stderr):  # type: ignore[union-attr]
+                    break
 
         elapsed = time.monotonic() - t0
+        # Strip once: outputs can be large and are needed in several places
+        out = stdout.strip()
+        err = stderr.strip()
 
         if returncode == 0:
             logger.info(
@@ -978,20 +1770,31 @@ def create_server(
                 "✗ %s failed (exit %d) in %.1fs",
                 resolved.tool.name, returncode, elapsed,
             )
-            if stderr.strip():
-                logger.debug("stderr: %s", stderr.strip()[:200])
+            if err:
+                logger.debug("stderr: %s", err[:200])
 
         # Build response
         parts = []
-        if stdout.strip():
-            parts.append(stdout.strip())
-        if stderr.strip():
-            parts.append(f"[stderr]\n{stderr.strip()}")
+        if out:
+            parts.append(out)
+        if err:
+            parts.append(f"[stderr]\n{err}")
         if returncode != 0:
             parts.append(f"[exit code: {returncode}]")
 
         text = "\n\n".join(parts) if parts else "(no output)"
 
+        return returncode == 0, text
+
+    async def _execute_tool(
+        resolved: ResolvedTool,
+        arguments: dict[str, Any],
+    ) -> list[types.TextContent]:
+        """Execute a resolved tool and wrap the response for MCP.
+
+        Shared by both classic call_tool and climax_call meta-tool.
+        """
+        _, text = await _run_tool(resolved, arguments)
         return [types.TextContent(type="text", text=text)]
 
     async def _handle_climax_search(arguments: dict[str, Any]) -> list[types.TextContent]:
@@ -1022,60 +1825,104 @@ def create_server(
 
         return [types.TextContent(type="text", text=json.dumps(response))]
 
-    async def _handle_climax_call(arguments: dict[str, Any]) -> list[types.TextContent]:
-        """Handle climax_call meta-tool calls."""
-        tool_name = arguments.get("tool_name")
-        if tool_name is None:
-            return [types.TextContent(type="text", text="Missing required argument 'tool_name'")]
-
-        call_args = arguments.get("args") or {}
-
+    async def _invoke(tool_name: str, call_args: dict[str, Any]) -> tuple[bool, str]:
+        """Resolve, validate and run a tool by name. Returns (ok, response text)."""
         # Resolve from tool_map (policy-filtered) to enforce policy constraints
         resolved = tool_map.get(tool_name)
         if not resolved:
             available = sorted(tool_map.keys())
-            return [types.TextContent(
-                type="text",
-                text=f"Unknown tool: {tool_name}. Available tools: {', '.join(available)}",
-            )]
+            return False, f"Unknown tool: {tool_name}. Available tools: {', '.join(available)}"
 
         # Validate and coerce arguments
         coerced_args, errors = validate_tool_args(call_args, resolved.tool)
         if errors:
-            error_text = "Argument validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
-            return [types.TextContent(type="text", text=error_text)]
+            return False, "Argument validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
+
+        return await _run_tool(resolved, coerced_args)
+
+    async def _handle_climax_call(arguments: dict[str, Any]) -> list[types.TextContent]:
+        """Handle climax_call meta-tool calls."""
+        tool_name = arguments.get("tool_name")
+        if tool_name is None:
+            return [types.TextContent(type="text", text="Missing required argument 'tool_name'")]
 
-        return await _execute_tool(resolved, coerced_args)
+        _, text = await _invoke(tool_name, arguments.get("args") or {})
+        return [types.TextContent(type="text", text=text)]
+
+    async def _handle_climax_batch(arguments: dict[str, Any]) -> list[types.TextContent]:
+        """Handle climax_batch meta-tool calls."""
+        calls = arguments.get("calls")
+        if not isinstance(calls, list) or not calls:
+            return [types.TextContent(type="text", text="Missing required argument 'calls'")]
+        if len(calls) > _BATCH_MAX_CALLS:
+            return [types.TextContent(
+                type="text", text=f"Too many calls: {len(calls)} (at most {_BATCH_MAX_CALLS} per batch)",
+            )]
+        try:
+            max_concurrent = min(max(1, int(arguments.get("max_concurrent", 4))), _BATCH_MAX_CONCURRENT)
+        except (ValueError, TypeError):
+            max_concurrent = 4
+        stop_on_error = arguments.get("stop_on_error", False)
+        if not isinstance(stop_on_error, bool):
+            return [types.TextContent(type="text", text="Argument 'stop_on_error' must be a boolean")]
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+        failed = False
+
+        async def _run_one(call: Any) -> dict[str, Any]:
+            nonlocal failed
+            if not isinstance(call, dict):
+                call = {}
+            tool_name = call.get("tool_name")
+            call_args = call.get("args") or {}
+            if tool_name is None:
+                ok, text = False, "Missing required field 'tool_name'"
+            elif not isinstance(tool_name, str):
+                ok, text = False, "Field 'tool_name' must be a string"
+            elif not isinstance(call_args, dict):
+                ok, text = False, "Field 'args' must be an object"
+            else:
+                async with semaphore:
+                    if failed and stop_on_error:
+                        return {"tool_name": tool_name, "ok": False, "output": "(skipped after earlier failure)"}
+                    ok, text = await _invoke(tool_name, call_args)
+            if not ok:
+                failed = True
+            return {"tool_name": tool_name, "ok": ok, "output": text}
+
+        results = await asyncio.gather(*(_run_one(call) for call in calls))
+        return [types.TextContent(type="text", text=json.dumps({"results": results}))]
+
+    # Name → handler table, built once: meta-tools in default mode, one
+    # pre-bound executor per tool in classic mode.
+    if not classic and index is not None:
+        _dispatch: dict[str, Callable[[dict[str, Any]], Awaitable[list[types.TextContent]]]] = {
+            "climax_search": _handle_climax_search,
+            "climax_call": _handle_climax_call,
+        }
+        if batch:
+            _dispatch["climax_batch"] = _handle_climax_batch
+        _available = ", ".join(_dispatch)
+    else:
+        _dispatch = {
+            name: functools.partial(_execute_tool, resolved)
+            for name, resolved in tool_map.items()
+        }
+        if batch:
+            _dispatch["climax_batch"] = _handle_climax_batch
+        _available = ", ".join(sorted(_dispatch))
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict[str, Any] | None) -> list[types.TextContent]:
         """Execute the CLI command for the given tool."""
-        arguments = arguments or {}
-
-        # Default mode: dispatch to meta-tool handlers
-        if not classic and index is not None:
-            if name == "climax_search":
-                return await _handle_climax_search(arguments)
-            elif name == "climax_call":
-                return await _handle_climax_call(arguments)
-            else:
-                logger.warning("Unknown tool called: %s", name)
-                return [types.TextContent(
-                    type="text",
-                    text=f"Unknown tool: {name}. Available tools: climax_search, climax_call",
-                )]
-
-        # Classic mode: dispatch to individual tools
-        resolved = tool_map.get(name)
-        if not resolved:
+        handler = _dispatch.get(name)
+        if handler is None:
             logger.warning("Unknown tool called: %s", name)
-            available = sorted(tool_map.keys())
             return [types.TextContent(
                 type="text",
-                text=f"Unknown tool: {name}. Available tools: {', '.join(available)}",
+                text=f"Unknown tool: {name}. Available tools: {_available}",
             )]
-
-        return await _execute_tool(resolved, arguments)
+        return await handler(arguments or {})
 
     return server
 
@@ -1090,26 +1937,34 @@ def cmd_validate(args, console: Console | None = None) -> int:
     valid = 0
     invalid = 0
 
-    for path in args.configs:
+    def check(path):
+        """Load one config and resolve its binary; returns (config, binary, error)."""
         try:
             config = load_config(path)
-            console.print(f"  [green]✓[/green] {config.name} — {len(config.tools)} tool(s)")
-
-            # Deep check: warn if command binary is not on PATH
-            binary = os.path.expandvars(os.path.expanduser(config.command)).split()[0]
-            if not shutil.which(binary):
-                console.print(f"    [yellow]⚠ '{binary}' not found on PATH[/yellow]")
-
-            valid += 1
-        except ValidationError as e:
+            prefix = _command_prefix(config.command)
+            return config, prefix[0] if prefix else "", None
+        except Exception as e:
+            return None, None, e
+
+    # Configs are loaded in parallel, then reported in the order given
+    results = _map_paths(check, list(args.configs))
+    # Deep check: warn if command binary is not on PATH — one lookup per distinct binary
+    on_path = {binary: shutil.which(binary) is not None for binary in {r[1] for r in results if r[1]}}
+    for path, (config, binary, error) in zip(args.configs, results):
+        if isinstance(error, ValidationError):
             console.print(f"  [red]✗[/red] {path}")
-            for err in e.errors():
+            for err in error.errors():
                 loc = " → ".join(str(l) for l in err["loc"])
                 console.print(f"    {loc}: {err['msg']}")
             invalid += 1
-        except Exception as e:
-            console.print(f"  [red]✗[/red] {path}: {e}")
+        elif error is not None:
+            console.print(f"  [red]✗[/red] {path}: {error}")
             invalid += 1
+        else:
+            console.print(f"  [green]✓[/green] {config.name} — {len(config.tools)} tool(s)")
+            if not on_path.get(binary, False):
+                console.print(f"    [yellow]⚠ '{binary}' not found on PATH[/yellow]")
+            valid += 1
 
     # Validate policy file if provided
     policy_path = getattr(args, "policy", None)
@@ -1176,14 +2031,15 @@ def cmd_list(args, console: Console | None = None) -> int:
             f"(image={policy.executor.image})[/dim]\n"
         )
 
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold")
     table.add_column("Tool")
     table.add_column("Description")
     table.add_column("Command")
     table.add_column("Arguments")
 
-    for name in sorted(tool_map):
-        resolved = tool_map[name]
+    for name, resolved in sorted(tool_map.items()):
         td = resolved.tool
         description = resolved.description_override or td.description
 
@@ -1249,6 +2105,34 @@ def cmd_skill(args, console: Console | None = None) -> int:
     return 0
 
 
+def _use_pidfd_child_watcher() -> None:
+    """Reap subprocesses via pidfd instead of a waiter thread per spawn.
+
+    Python 3.11's default ThreadedChildWatcher starts a thread for every
+    child, which adds overhead when a client issues many tool calls at once.
+    Python 3.12+ already picks the pidfd watcher on Linux, so this only
+    applies to Linux on 3.11 with a kernel that supports pidfd_open (5.3+).
+    """
+    if sys.platform != "linux" or sys.version_info >= (3, 12):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except (AttributeError, OSError):
+        return
+    asyncio.set_child_watcher(asyncio.PidfdChildWatcher())
+
+
+def _exit_on_sigterm() -> None:
+    """Turn SIGTERM into SystemExit so atexit cleanup still runs.
+
+    MCP clients usually stop the server with SIGTERM, whose default action
+    skips atexit handlers and would leak a reused executor container. A
+    handler installed by an embedding application is left alone.
+    """
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+
+
 def cmd_run(args) -> None:
     """Start the MCP server (stdio transport)."""
     logger.setLevel(getattr(logging, args.log_level))
@@ -1264,7 +2148,12 @@ def cmd_run(args) -> None:
 
     is_classic = getattr(args, "classic", False)
     index = ToolIndex.from_configs(configs)
-    server = create_server(server_name, tool_map, executor=executor, index=index, classic=is_classic)
+    server = create_server(
+        server_name, tool_map, executor=executor, index=index,
+        classic=is_classic, batch=getattr(args, "batch", False),
+    )
+
+    import mcp.server.stdio
 
     async def run():
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
@@ -1274,6 +2163,10 @@ def cmd_run(args) -> None:
                 server.create_initialization_options(),
             )
 
+    _use_pidfd_child_watcher()
+    if executor and executor.type == ExecutorType.docker and executor.reuse_container:
+        # Only a reused container needs atexit cleanup to survive SIGTERM
+        _exit_on_sigterm()
     asyncio.run(run())
 
 
@@ -1295,21 +2188,48 @@ def _build_run_parser(parser=None):
     parser.add_argument("configs", nargs="+", metavar="CONFIG")
     _add_policy_arg(parser)
     parser.add_argument("--classic", action="store_true", default=False, help="Classic mode: register all tools directly")
+    parser.add_argument("--batch", action="store_true", default=False, help="Also register the climax_batch meta-tool")
     parser.add_argument("--transport", choices=["stdio"], default="stdio", help="MCP transport (default: stdio)")
     parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], default="WARNING", help="Logging level")
     return parser
 
 
+def _build_validate_parser(parser):
+    """Add the 'validate' arguments to parser."""
+    parser.add_argument("configs", nargs="+", metavar="CONFIG")
+    _add_policy_arg(parser)
+
+
+def _build_list_parser(parser):
+    """Add the 'list' arguments to parser."""
+    parser.add_argument("configs", nargs="*", metavar="CONFIG")
+    _add_policy_arg(parser)
+
+
+def _build_skill_parser(parser):
+    """Add the 'skill' arguments to parser."""
+    skill_group = parser.add_mutually_exclusive_group()
+    skill_group.add_argument("--path", action="store_true", help="Print the path to SKILL.md")
+    skill_group.add_argument("--install", action="store_true", help="Install to .claude/commands/climax-config.md")
+
+
+# Subcommand name → (help text, function that adds its arguments)
+_SUBCOMMANDS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "validate": ("Validate config file(s)", _build_validate_parser),
+    "list": ("List tools from config file(s)", _build_list_parser),
+    "run": ("Start MCP server", _build_run_parser),
+    "skill": ("Print or install the CLImax skill file", _build_skill_parser),
+}
+
+
 def main():
     import argparse
 
-    SUBCOMMANDS = {"validate", "list", "run", "skill"}
-
     # Check if the first positional arg is a known subcommand
     argv = sys.argv[1:]
     first_positional = next((a for a in argv if not a.startswith("-")), None)
 
-    if first_positional not in SUBCOMMANDS:
+    if first_positional not in _SUBCOMMANDS:
         # Backward compat: climax config.yaml [--log-level ...]
         run_parser = _build_run_parser()
         args = run_parser.parse_args(argv)
@@ -1320,25 +2240,12 @@ def main():
         description="CLImax: expose any CLI as MCP tools via YAML config"
     )
     subparsers = parser.add_subparsers(dest="subcommand")
-
-    # --- validate ---
-    p_validate = subparsers.add_parser("validate", help="Validate config file(s)")
-    p_validate.add_argument("configs", nargs="+", metavar="CONFIG")
-    _add_policy_arg(p_validate)
-
-    # --- list ---
-    p_list = subparsers.add_parser("list", help="List tools from config file(s)")
-    p_list.add_argument("configs", nargs="*", metavar="CONFIG")
-    _add_policy_arg(p_list)
-
-    # --- run ---
-    _build_run_parser(subparsers.add_parser("run", help="Start MCP server"))
-
-    # --- skill ---
-    p_skill = subparsers.add_parser("skill", help="Print or install the CLImax skill file")
-    skill_group = p_skill.add_mutually_exclusive_group()
-    skill_group.add_argument("--path", action="store_true", help="Print the path to SKILL.md")
-    skill_group.add_argument("--install", action="store_true", help="Install to .claude/commands/climax-config.md")
+    # Every subcommand is listed in --help, but only the one being invoked
+    # gets its arguments built
+    for name, (help_text, build) in _SUBCOMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if name == first_positional:
+            build(sub)
 
     args = parser.parse_args(argv)
 
@@ -64,12 +64,13 @@ def simple_config(simple_tool):
 
 
 # ---------------------------------------------------------------------------
-# YAML file fixtures (use tmp_path)
+# YAML file fixtures (read-only ones are written once per session)
 # ---------------------------------------------------------------------------
 
 
 @pytest.fixture
 def valid_yaml(tmp_path):
+    """Function-scoped: the config cache tests rewrite this file."""
     content = textwrap.dedent("""\
         name: test-tools
         command: echo
@@ -88,21 +89,21 @@ def valid_yaml(tmp_path):
     return p
 
 
-@pytest.fixture
-def minimal_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def minimal_yaml(tmp_path_factory):
     content = textwrap.dedent("""\
         command: echo
         tools:
           - name: ping
             description: Ping
     """)
-    p = tmp_path / "minimal.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "minimal.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def second_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def second_yaml(tmp_path_factory):
     """A second config for multi-config merge tests."""
     content = textwrap.dedent("""\
         name: extra-tools
@@ -116,13 +117,13 @@ def second_yaml(tmp_path):
                 type: string
                 positional: true
     """)
-    p = tmp_path / "second.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "second.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def duplicate_tool_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def duplicate_tool_yaml(tmp_path_factory):
     """Config that defines a tool with the same name as valid_yaml's 'hello'."""
     content = textwrap.dedent("""\
         name: dup-tools
@@ -131,33 +132,33 @@ def duplicate_tool_yaml(tmp_path):
           - name: hello
             description: Duplicate hello
     """)
-    p = tmp_path / "dup.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "dup.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def invalid_yaml_syntax(tmp_path):
-    p = tmp_path / "bad_syntax.yaml"
+@pytest.fixture(scope="session")
+def invalid_yaml_syntax(tmp_path_factory):
+    p = tmp_path_factory.mktemp("yaml") / "bad_syntax.yaml"
     p.write_text("name: foo\n  bad indent: [")
     return p
 
 
-@pytest.fixture
-def missing_command_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def missing_command_yaml(tmp_path_factory):
     content = textwrap.dedent("""\
         name: broken
         tools:
           - name: oops
             description: This should fail
     """)
-    p = tmp_path / "no_command.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "no_command.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def invalid_arg_type_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def invalid_arg_type_yaml(tmp_path_factory):
     content = textwrap.dedent("""\
         name: broken
         command: echo
@@ -168,13 +169,13 @@ def invalid_arg_type_yaml(tmp_path):
               - name: x
                 type: banana
     """)
-    p = tmp_path / "bad_type.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "bad_type.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def global_args_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def global_args_yaml(tmp_path_factory):
     """Config with global_args defined at config level."""
     content = textwrap.dedent("""\
         name: vault-cli
@@ -192,13 +193,13 @@ def global_args_yaml(tmp_path):
                 type: string
                 flag: "query="
     """)
-    p = tmp_path / "global_args.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "global_args.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def category_tags_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def category_tags_yaml(tmp_path_factory):
     """Config with both category and tags fields."""
     content = textwrap.dedent("""\
         name: tagged-cli
@@ -209,13 +210,13 @@ def category_tags_yaml(tmp_path):
           - name: do_thing
             description: Do a thing
     """)
-    p = tmp_path / "category_tags.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "category_tags.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def category_only_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def category_only_yaml(tmp_path_factory):
     """Config with category but no tags."""
     content = textwrap.dedent("""\
         name: cat-only
@@ -225,13 +226,13 @@ def category_only_yaml(tmp_path):
           - name: deploy
             description: Deploy something
     """)
-    p = tmp_path / "category_only.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "category_only.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def tags_only_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def tags_only_yaml(tmp_path_factory):
     """Config with tags but no category."""
     content = textwrap.dedent("""\
         name: tags-only
@@ -241,13 +242,13 @@ def tags_only_yaml(tmp_path):
           - name: build
             description: Build something
     """)
-    p = tmp_path / "tags_only.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "tags_only.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def no_category_tags_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def no_category_tags_yaml(tmp_path_factory):
     """Config without category or tags (backward compat)."""
     content = textwrap.dedent("""\
         name: plain-cli
@@ -256,7 +257,7 @@ def no_category_tags_yaml(tmp_path):
           - name: plain_tool
             description: A plain tool
     """)
-    p = tmp_path / "no_category_tags.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "no_category_tags.yaml"
     p.write_text(content)
     return p
 
@@ -313,6 +314,7 @@ def enabled_default_policy():
 
 @pytest.fixture
 def minimal_policy_yaml(tmp_path):
+    """Function-scoped: the policy cache test rewrites this file."""
     content = textwrap.dedent("""\
         tools:
           hello: {}
@@ -322,8 +324,8 @@ def minimal_policy_yaml(tmp_path):
     return p
 
 
-@pytest.fixture
-def full_policy_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def full_policy_yaml(tmp_path_factory):
     content = textwrap.dedent("""\
         executor:
           type: docker
@@ -340,13 +342,13 @@ def full_policy_yaml(tmp_path):
               name:
                 pattern: "^[a-z]+$"
     """)
-    p = tmp_path / "full_policy.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "full_policy.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def invalid_policy_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def invalid_policy_yaml(tmp_path_factory):
     """Policy with docker executor but no image — should fail validation."""
     content = textwrap.dedent("""\
         executor:
@@ -354,13 +356,13 @@ def invalid_policy_yaml(tmp_path):
         tools:
           hello: {}
     """)
-    p = tmp_path / "invalid_policy.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "invalid_policy.yaml"
     p.write_text(content)
     return p
 
 
-@pytest.fixture
-def constraint_policy_yaml(tmp_path):
+@pytest.fixture(scope="session")
+def constraint_policy_yaml(tmp_path_factory):
     """Policy with argument constraints for testing validation."""
     content = textwrap.dedent("""\
         default: disabled
@@ -374,6 +376,6 @@ def constraint_policy_yaml(tmp_path):
               message:
                 pattern: "^[\\\\w\\\\s]+$"
     """)
-    p = tmp_path / "constraint_policy.yaml"
+    p = tmp_path_factory.mktemp("yaml") / "constraint_policy.yaml"
     p.write_text(content)
     return p
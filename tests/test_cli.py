@@ -1,7 +1,6 @@
 """Tests for CLI subcommands (validate, list, backward compat)."""
 
 import argparse
-import importlib
 import logging
 import os
 import textwrap
@@ -80,11 +79,36 @@ class TestCmdValidate:
         p.write_text(content)
 
         console, buf = _capture_console()
-        rc = cmd_validate(_make_args([str(p)]), console=console)
+        with patch("climax.shutil.which", return_value=None) as mock_which:
+            rc = cmd_validate(_make_args([str(p)]), console=console)
+        mock_which.assert_called_once_with("definitely_not_a_real_binary_xyz")
         output = buf.getvalue()
         assert rc == 0  # still valid, just a warning
         assert "⚠" in output or "not found on PATH" in output
 
+    def test_shared_binary_looked_up_once(self, valid_yaml, minimal_yaml):
+        console, buf = _capture_console()
+        with patch("climax.shutil.which", return_value="/bin/echo") as mock_which:
+            rc = cmd_validate(_make_args([str(valid_yaml), str(minimal_yaml)]), console=console)
+        assert rc == 0
+        mock_which.assert_called_once_with("echo")
+
+    def test_binary_expanded_like_runtime(self, tmp_path):
+        cfg = tmp_path / "quoted.yaml"
+        cfg.write_text(textwrap.dedent("""\
+            name: quoted
+            command: $CLIMAX_TEST_DIR/bin/tool
+            tools:
+              - name: t
+                description: test
+        """))
+        console, buf = _capture_console()
+        with patch.dict("os.environ", {"CLIMAX_TEST_DIR": "/opt/o'brien"}), \
+                patch("climax.shutil.which", return_value=None) as mock_which:
+            rc = cmd_validate(_make_args([str(cfg)]), console=console)
+        assert rc == 0
+        mock_which.assert_called_once_with("/opt/o'brien/bin/tool")
+
 
 class TestCmdList:
     def test_list_output(self, valid_yaml):
@@ -463,6 +487,15 @@ class TestCmdSkill:
 
 
 class TestCmdRun:
+    @pytest.fixture(autouse=True)
+    def _restore_sigterm(self):
+        """cmd_run installs a SIGTERM handler; keep it out of the test process."""
+        import signal
+
+        previous = signal.getsignal(signal.SIGTERM)
+        yield
+        signal.signal(signal.SIGTERM, previous)
+
     def test_cmd_run_basic(self, valid_yaml):
         """cmd_run loads configs, creates server, and calls asyncio.run."""
         args = argparse.Namespace(
@@ -489,6 +522,24 @@ class TestCmdRun:
         # executor kwarg should be passed (from the policy)
         assert "executor" in mock_create.call_args.kwargs
 
+    def test_sigterm_handler_only_for_reused_container(self, valid_yaml, tmp_path):
+        args = argparse.Namespace(configs=[str(valid_yaml)], policy=None, log_level="WARNING")
+        with patch("climax.asyncio.run"), patch("climax._exit_on_sigterm") as mock_exit:
+            cmd_run(args)
+        mock_exit.assert_not_called()
+
+        policy = tmp_path / "policy.yaml"
+        policy.write_text(textwrap.dedent("""\
+            executor:
+              type: docker
+              image: alpine:latest
+              reuse_container: true
+        """))
+        args.policy = str(policy)
+        with patch("climax.asyncio.run"), patch("climax._exit_on_sigterm") as mock_exit:
+            cmd_run(args)
+        mock_exit.assert_called_once()
+
     def test_cmd_run_sets_log_level(self, valid_yaml):
         """cmd_run should set logger level from args."""
         args = argparse.Namespace(
@@ -503,6 +554,56 @@ class TestCmdRun:
         climax.logger.setLevel(logging.WARNING)
 
 
+class TestChildWatcher:
+    def test_pidfd_watcher_installed_on_linux_311(self):
+        with patch("climax.sys.platform", "linux"), \
+                patch("climax.sys.version_info", (3, 11, 0)), \
+                patch("climax.os.pidfd_open", return_value=os.open(os.devnull, os.O_RDONLY), create=True), \
+                patch("climax.asyncio.set_child_watcher", create=True) as mock_set, \
+                patch("climax.asyncio.PidfdChildWatcher", create=True) as mock_watcher:
+            climax._use_pidfd_child_watcher()
+        mock_set.assert_called_once_with(mock_watcher.return_value)
+
+    @pytest.mark.parametrize("platform,version", [("linux", (3, 12, 0)), ("darwin", (3, 11, 0))])
+    def test_pidfd_watcher_skipped(self, platform, version):
+        with patch("climax.sys.platform", platform), \
+                patch("climax.sys.version_info", version), \
+                patch("climax.asyncio.set_child_watcher", create=True) as mock_set:
+            climax._use_pidfd_child_watcher()
+        mock_set.assert_not_called()
+
+
+class TestExitOnSigterm:
+    def test_sigterm_runs_atexit_handlers(self):
+        """A SIGTERM'd server still runs atexit cleanup (e.g. removing executor containers)."""
+        import subprocess
+        import sys
+
+        code = (
+            "import atexit, os, signal, time, climax\n"
+            "atexit.register(print, 'cleaned up', flush=True)\n"
+            "climax._exit_on_sigterm()\n"
+            "os.kill(os.getpid(), signal.SIGTERM)\n"
+            "time.sleep(5)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=30)
+        assert result.stdout.strip() == "cleaned up"
+        assert result.returncode == 128 + 15
+
+    def test_existing_handler_left_alone(self):
+        import signal
+
+        def handler(signum, frame):
+            pass
+
+        previous = signal.signal(signal.SIGTERM, handler)
+        try:
+            climax._exit_on_sigterm()
+            assert signal.getsignal(signal.SIGTERM) is handler
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+
+
 class TestMainSubcommands:
     def test_main_validate_subcommand(self, valid_yaml):
         """main() with 'validate' dispatches to cmd_validate."""
@@ -529,6 +630,17 @@ class TestMainSubcommands:
                 main()
             mock_run.assert_called_once()
 
+    def test_main_builds_only_invoked_subcommand(self, valid_yaml):
+        """Only the invoked subcommand's arguments are built."""
+        mock_build_run = MagicMock()
+        with patch("climax.cmd_validate", return_value=0) as mock_validate, \
+                patch.dict(climax._SUBCOMMANDS, {"run": ("Start MCP server", mock_build_run)}), \
+                patch("sys.argv", ["climax", "validate", str(valid_yaml)]):
+            with pytest.raises(SystemExit):
+                main()
+        mock_build_run.assert_not_called()
+        assert mock_validate.call_args[0][0].configs == [str(valid_yaml)]
+
     def test_main_validate_with_policy(self, valid_yaml, minimal_policy_yaml):
         """main() passes --policy flag through to cmd_validate."""
         with patch("climax.cmd_validate", return_value=0) as mock_validate:
@@ -543,23 +655,45 @@ class TestMainSubcommands:
 
 class TestLogFileEnvVar:
     def test_log_file_env_creates_handler(self, tmp_path):
-        """Setting CLIMAX_LOG_FILE should add a FileHandler at DEBUG level."""
+        """CLIMAX_LOG_FILE's handler logs to the file at DEBUG level."""
         log_file = tmp_path / "climax_test.log"
-
-        with patch.dict(os.environ, {"CLIMAX_LOG_FILE": str(log_file)}):
-            importlib.reload(climax)
-
-        logger = climax.logger
-        file_handlers = [
-            h for h in logger.handlers if isinstance(h, logging.FileHandler)
-        ]
-        assert len(file_handlers) >= 1
-        fh = file_handlers[-1]
-        assert fh.level == logging.DEBUG
-
-        # Clean up: remove the handler and reload without env var
-        logger.removeHandler(fh)
-        fh.close()
-        with patch.dict(os.environ, {}, clear=False):
-            os.environ.pop("CLIMAX_LOG_FILE", None)
-            importlib.reload(climax)
+        logger = logging.getLogger("climax.test_log_file")
+        logger.setLevel(logging.DEBUG)
+
+        fh = climax._configure_file_handler(logger, str(log_file))
+        try:
+            assert fh in logger.handlers
+            assert fh.level == logging.DEBUG
+            logger.debug("hello file")
+            fh.flush()
+            assert "DEBUG    hello file" in log_file.read_text()
+        finally:
+            logger.removeHandler(fh)
+            fh.close()
+
+
+class TestMaxOutputEnvVar:
+    def test_env_overrides_output_cap(self):
+        """CLIMAX_MAX_OUTPUT_BYTES should change the per-stream cap."""
+        assert climax._max_output_bytes_from_env({"CLIMAX_MAX_OUTPUT_BYTES": "4096"}) == 4096
+
+    def test_default_and_invalid_values(self, caplog):
+        default = 16 * 1024 * 1024
+        assert climax._max_output_bytes_from_env({}) == default
+        with caplog.at_level(logging.WARNING, logger="climax"):
+            assert climax._max_output_bytes_from_env({"CLIMAX_MAX_OUTPUT_BYTES": "lots"}) == default
+        assert "Ignoring invalid CLIMAX_MAX_OUTPUT_BYTES='lots'" in caplog.text
+
+    def test_cap_is_at_least_one_byte(self):
+        assert climax._max_output_bytes_from_env({"CLIMAX_MAX_OUTPUT_BYTES": "0"}) == 1
+
+
+class TestLazyImports:
+    def test_import_does_not_load_mcp_server(self):
+        """validate/list should not pay for importing the MCP server stack."""
+        import subprocess
+        import sys
+
+        code = "import sys, climax; print(any(m == 'mcp' or m.startswith('mcp.') for m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
@@ -2,7 +2,10 @@
 
 from unittest.mock import patch
 
-from climax import ArgType, ToolArg, ToolDef, build_command
+import pytest
+from pydantic import ValidationError
+
+from climax import ArgType, ResolvedTool, ToolArg, ToolDef, build_command, build_input_schema
 
 
 class TestBuildCommand:
@@ -319,3 +322,85 @@ class TestBuildCommandGlobalArgs:
         tool = ToolDef(name="t", description="test", command="status")
         cmd = build_command("git", tool, {}, global_args=[])
         assert cmd == ["git", "status"]
+
+
+class TestResolvedToolCommand:
+    """ResolvedTool.build_command uses precomputed tokens and arg partitions."""
+
+    def _resolved(self, **kwargs):
+        tool = ToolDef(
+            name="t",
+            description="test",
+            command="log --oneline",
+            args=[
+                ToolArg(name="verbose", type=ArgType.boolean, flag="--verbose"),
+                ToolArg(name="path", positional=True),
+                ToolArg(name="max_count", type=ArgType.integer, default=5),
+                ToolArg(name="directory", cwd=True),
+                ToolArg(name="content", stdin=True),
+            ],
+        )
+        return ResolvedTool(tool=tool, base_command="git", **kwargs)
+
+    def test_matches_build_command(self):
+        resolved = self._resolved()
+        arguments = {"verbose": True, "path": "src", "directory": "/tmp", "content": "x"}
+        expected = build_command("git", resolved.tool, arguments)
+        assert resolved.build_command(arguments) == expected
+        assert expected == ["git", "log", "--oneline", "src", "--verbose", "--max-count", "5"]
+
+    def test_repeated_calls_do_not_share_lists(self):
+        resolved = self._resolved()
+        first = resolved.build_command({"path": "a"})
+        first.append("mutated")
+        assert resolved.build_command({"path": "b"}) == ["git", "log", "--oneline", "b", "--max-count", "5"]
+
+    def test_global_args_applied(self):
+        ga = [ToolArg(name="vault", flag="vault=", default="work")]
+        resolved = self._resolved(global_args=ga)
+        assert resolved.build_command({})[-1] == "vault=work"
+
+    def test_input_schema_precomputed(self):
+        resolved = self._resolved()
+        assert resolved.input_schema == build_input_schema(resolved.tool.args)
+
+
+class TestCommandSplitting:
+    def test_quoted_base_command_with_spaces(self):
+        tool = ToolDef(name="t", description="test", command='run "two words"')
+        cmd = build_command('"/opt/my app/bin/tool" --quiet', tool, {})
+        assert cmd == ["/opt/my app/bin/tool", "--quiet", "run", "two words"]
+
+    def test_unbalanced_quote_rejected(self):
+        with pytest.raises(ValidationError, match="cannot split command"):
+            ToolDef(name="t", description="test", command='say "hi')
+
+    def test_env_var_with_spaces_split_into_tokens(self):
+        tool = ToolDef(name="t", description="test", command="status")
+        with patch.dict("os.environ", {"CLIMAX_TEST_CMD": "python -m myapp"}):
+            cmd = build_command("$CLIMAX_TEST_CMD --quiet", tool, {})
+        assert cmd == ["python", "-m", "myapp", "--quiet", "status"]
+
+    def test_quoted_env_var_kept_as_one_token(self):
+        tool = ToolDef(name="t", description="test")
+        with patch.dict("os.environ", {"CLIMAX_TEST_DIR": "/opt/my app"}):
+            cmd = build_command('"$CLIMAX_TEST_DIR/bin/tool"', tool, {})
+        assert cmd == ["/opt/my app/bin/tool"]
+
+    def test_env_var_with_quote_not_reparsed(self):
+        tool = ToolDef(name="t", description="test")
+        with patch.dict("os.environ", {"CLIMAX_TEST_DIR": "/opt/o'brien"}):
+            cmd = build_command("$CLIMAX_TEST_DIR/bin/tool", tool, {})
+        assert cmd == ["/opt/o'brien/bin/tool"]
+
+    def test_env_var_with_spaces_in_path_kept_as_one_token(self):
+        tool = ToolDef(name="t", description="test")
+        with patch.dict("os.environ", {"CLIMAX_TEST_DIR": "/opt/my app\\x"}):
+            cmd = build_command("$CLIMAX_TEST_DIR/bin/tool --quiet", tool, {})
+        assert cmd == ["/opt/my app\\x/bin/tool", "--quiet"]
+
+    def test_braced_bare_env_var_split_into_tokens(self):
+        tool = ToolDef(name="t", description="test")
+        with patch.dict("os.environ", {"CLIMAX_TEST_CMD": "python -m myapp"}):
+            cmd = build_command("${CLIMAX_TEST_CMD}", tool, {})
+        assert cmd == ["python", "-m", "myapp"]
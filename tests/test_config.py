@@ -1,8 +1,14 @@
 """Tests for YAML config loading and validation."""
 
+import json
+from collections import OrderedDict
+from unittest.mock import patch
+
 import pytest
+import yaml
 from pydantic import ValidationError
 
+import climax
 from climax import CLImaxConfig, load_config, load_configs
 
 
@@ -36,6 +42,130 @@ class TestLoadConfig:
         with pytest.raises(Exception):
             load_config(invalid_yaml_syntax)
 
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+    def test_uses_libyaml_loader(self):
+        assert climax._YamlLoader is yaml.CSafeLoader
+
+
+class TestLoadConfigCache:
+    def test_repeated_load_returns_cached_config(self, valid_yaml):
+        first = load_config(valid_yaml)
+        second = load_config(valid_yaml)
+        assert first is second
+
+    def test_modified_file_is_reparsed(self, valid_yaml):
+        first = load_config(valid_yaml)
+        valid_yaml.write_text(valid_yaml.read_text().replace("test-tools", "changed-tools"))
+        second = load_config(valid_yaml)
+        assert second is not first
+        assert second.name == "changed-tools"
+
+    def test_invalid_config_not_cached(self, missing_command_yaml):
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                load_config(missing_command_yaml)
+
+
+class TestLoadConfigDiskCache:
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(climax, "_config_cache_dir", str(cache_dir))
+        monkeypatch.setattr(climax, "_config_cache", OrderedDict())
+        return cache_dir
+
+    def test_disabled_by_default(self, valid_yaml, tmp_path, monkeypatch):
+        monkeypatch.setattr(climax, "_config_cache_dir", None)
+        load_config(valid_yaml)
+        assert not (tmp_path / "cache").exists()
+
+    def test_writes_json_entry(self, valid_yaml, cache_dir):
+        load_config(valid_yaml)
+        entries = list(cache_dir.glob("*.json"))
+        assert len(entries) == 1
+        entry = json.loads(entries[0].read_text())
+        assert entry["fingerprint"] == climax._config_fingerprint()
+        assert entry["config"]["name"] == "test-tools"
+
+    def test_cached_entry_skips_yaml(self, valid_yaml, cache_dir, monkeypatch):
+        first = load_config(valid_yaml)
+        monkeypatch.setattr(climax, "_config_cache", OrderedDict())
+        with patch("climax.yaml.load", side_effect=AssertionError("YAML parsed")):
+            second = load_config(valid_yaml)
+        assert second == first
+
+    def test_cached_entry_rebuilds_nested_models(self, global_args_yaml, cache_dir, monkeypatch):
+        first = load_config(global_args_yaml)
+        monkeypatch.setattr(climax, "_config_cache", OrderedDict())
+        with patch.object(climax.CLImaxConfig, "__init__", side_effect=AssertionError("validated")):
+            second = load_config(global_args_yaml)
+        assert second == first
+        assert isinstance(second.global_args[0], climax.ToolArg)
+        assert isinstance(second.tools[0], climax.ToolDef)
+        assert second.tools[0].args[0].type == climax.ArgType.string
+
+    def test_entry_from_other_version_not_reused(self, valid_yaml, cache_dir, monkeypatch):
+        load_config(valid_yaml)
+        monkeypatch.setattr(climax, "_config_cache", OrderedDict())
+        monkeypatch.setattr(climax, "_config_fingerprint", lambda: "other-version")
+        with patch("climax.yaml.load", wraps=yaml.load) as mock_load:
+            load_config(valid_yaml)
+        mock_load.assert_called_once()
+        # The other version's entry for the same file is pruned
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_stale_entries_pruned_on_edit(self, valid_yaml, minimal_yaml, cache_dir, monkeypatch):
+        load_config(minimal_yaml)
+        (other_entry,) = cache_dir.glob("*.json")
+        load_config(valid_yaml)
+        first_entries = set(cache_dir.glob("*.json")) - {other_entry}
+        valid_yaml.write_text(valid_yaml.read_text() + "\n# edited\n")
+        monkeypatch.setattr(climax, "_config_cache", OrderedDict())
+        load_config(valid_yaml)
+        entries = set(cache_dir.glob("*.json"))
+        assert len(entries) == 2
+        assert other_entry in entries  # other config files keep their entry
+        assert not first_entries & entries
+
+    def _rewrite_entry(self, cache_dir, **changes):
+        (entry_path,) = cache_dir.glob("*.json")
+        entry = json.loads(entry_path.read_text())
+        entry.update(changes)
+        entry_path.write_text(json.dumps(entry))
+        return entry
+
+    def test_fingerprint_mismatch_revalidates(self, valid_yaml, cache_dir, monkeypatch):
+        load_config(valid_yaml)
+        entry = self._rewrite_entry(cache_dir, fingerprint="stale")
+        entry["config"]["command"] = "echo 'unbalanced"
+        self._rewrite_entry(cache_dir, config=entry["config"])
+        monkeypatch.setattr(climax, "_config_cache", OrderedDict())
+        # The stale entry fails validation, so the YAML is parsed again
+        assert load_config(valid_yaml).command == "echo"
+
+    def test_fingerprint_mismatch_uses_valid_entry(self, valid_yaml, cache_dir, monkeypatch):
+        load_config(valid_yaml)
+        self._rewrite_entry(cache_dir, fingerprint="stale")
+        monkeypatch.setattr(climax, "_config_cache", OrderedDict())
+        with patch("climax.yaml.load", side_effect=AssertionError("YAML parsed")):
+            assert load_config(valid_yaml).name == "test-tools"
+
+    def test_unconstructable_entry_falls_back(self, valid_yaml, cache_dir, monkeypatch):
+        load_config(valid_yaml)
+        entry = json.loads(next(cache_dir.glob("*.json")).read_text())
+        entry["config"]["tools"] = "not-a-list"
+        self._rewrite_entry(cache_dir, config=entry["config"])
+        monkeypatch.setattr(climax, "_config_cache", OrderedDict())
+        config = load_config(valid_yaml)
+        assert config.tools[0].name == "hello"
+
+    def test_corrupt_entry_falls_back_to_yaml(self, valid_yaml, cache_dir, monkeypatch):
+        load_config(valid_yaml)
+        for entry in cache_dir.glob("*.json"):
+            entry.write_text("{not json")
+        monkeypatch.setattr(climax, "_config_cache", OrderedDict())
+        assert load_config(valid_yaml).name == "test-tools"
+
 
 class TestLoadConfigs:
     def test_single_config(self, valid_yaml):
@@ -50,12 +180,40 @@ class TestLoadConfigs:
         assert "hello" in tool_map
         assert "greet" in tool_map
 
+    def test_many_configs_keep_input_order(self, tmp_path):
+        paths = []
+        for i in range(12):
+            p = tmp_path / f"cfg{i}.yaml"
+            p.write_text(f"name: cfg{i}\ncommand: echo\ntools:\n  - name: t{i}\n    description: d\n")
+            paths.append(p)
+        _, tool_map, configs = load_configs(paths)
+        assert [c.name for c in configs] == [f"cfg{i}" for i in range(12)]
+        assert list(tool_map) == [f"t{i}" for i in range(12)]
+
+    def test_missing_file_among_many_raises(self, valid_yaml, second_yaml, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_configs([valid_yaml, tmp_path / "missing.yaml", second_yaml])
+
     def test_duplicate_tool_overwrites(self, valid_yaml, duplicate_tool_yaml):
         _, tool_map, _configs = load_configs([valid_yaml, duplicate_tool_yaml])
         assert "hello" in tool_map
         # The second config's tool should overwrite the first
         assert tool_map["hello"].base_command == "printf"
 
+    def test_resolved_tools_skip_revalidation(self, valid_yaml):
+        with patch.object(climax.ResolvedTool, "__init__", side_effect=AssertionError("validated")):
+            _, tool_map, _configs = load_configs([valid_yaml])
+        resolved = tool_map["hello"]
+        assert resolved.arg_constraints == {}
+        assert resolved.input_schema["type"] == "object"
+
+    def test_tool_names_interned(self, valid_yaml):
+        import sys
+
+        _, tool_map, _configs = load_configs([valid_yaml])
+        for name in tool_map:
+            assert sys.intern(name) is name
+
     def test_tool_timeout_preserved(self, tmp_path):
         import textwrap
 
@@ -21,6 +21,8 @@ from climax import (
     ToolDef,
     ToolPolicy,
     apply_policy,
+    DockerContainer,
+    build_docker_exec_prefix,
     build_docker_prefix,
     create_server,
     load_configs,
@@ -293,6 +295,144 @@ async def _call_tool(server, name, arguments=None):
     return _unwrap(await handlers[types.CallToolRequest](request))
 
 
+class TestDockerReuseContainer:
+    """Executor with reuse_container: one container, `docker exec` per call."""
+
+    def _server(self):
+        tool_map = {
+            "status": ResolvedTool(
+                tool=ToolDef(name="status", description="Status", command="status"),
+                base_command="git",
+            ),
+        }
+        executor = ExecutorConfig(
+            type=ExecutorType.docker,
+            image="alpine/git:latest",
+            working_dir="/workspace",
+            network="none",
+            reuse_container=True,
+        )
+        return create_server("reuse", tool_map, executor=executor)
+
+    def test_exec_prefix(self):
+        executor = ExecutorConfig(type=ExecutorType.docker, image="img", working_dir="/w")
+        assert build_docker_exec_prefix(executor, "c1") == ["docker", "exec", "-w", "/w", "c1"]
+        assert build_docker_exec_prefix(executor, "c1", {"K": "v"}) == [
+            "docker", "exec", "-w", "/w", "-e", "K=v", "c1",
+        ]
+
+    async def test_container_started_once(self):
+        server = self._server()
+
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run, \
+                patch("climax.atexit.register") as mock_register:
+            mock_run.return_value = (0, "ok\n", "")
+            await _call_tool(server, "status")
+            await _call_tool(server, "status")
+
+        start_cmd, first_cmd, second_cmd = (c.args[0] for c in mock_run.call_args_list)
+        assert start_cmd[:4] == ["docker", "run", "-d", "--rm"]
+        assert start_cmd[-4:] == ["--entrypoint", "sleep", "alpine/git:latest", "infinity"]
+        assert "--network" in start_cmd
+        name = start_cmd[start_cmd.index("--name") + 1]
+        assert first_cmd[:5] == ["docker", "exec", "-w", "/workspace", "-e"]
+        assert first_cmd[5].startswith("CLIMAX_CALL_ID=")
+        assert first_cmd[6:] == [name, "git", "status"]
+        assert second_cmd[6:] == first_cmd[6:]
+        assert second_cmd[5] != first_cmd[5]  # one marker per call
+        mock_register.assert_called_once()
+
+    async def test_timeout_kills_call_inside_container(self):
+        server = self._server()
+
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run, \
+                patch("climax.atexit.register"):
+            mock_run.side_effect = [
+                (0, "container-id\n", ""),
+                (-1, "", "Command timed out after 30.0s"),
+                (0, "", ""),
+            ]
+            result = await _call_tool(server, "status")
+
+        assert "timed out" in result.content[0].text
+        _, exec_cmd, kill_cmd = (c.args[0] for c in mock_run.call_args_list)
+        marker = exec_cmd[5]
+        name = exec_cmd[6]
+        assert kill_cmd[:5] == ["docker", "exec", name, "sh", "-c"]
+        assert f"grep -qx '{marker}'" in kill_cmd[5]
+
+    async def test_successful_call_not_killed(self):
+        server = self._server()
+
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run, \
+                patch("climax.atexit.register"):
+            mock_run.return_value = (0, "ok\n", "")
+            await _call_tool(server, "status")
+
+        assert mock_run.call_count == 2  # container start + the call itself
+
+    async def test_gone_container_restarted(self):
+        server = self._server()
+
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run, \
+                patch("climax.atexit.register") as mock_register:
+            mock_run.side_effect = [
+                (0, "container-id\n", ""),
+                (1, "", "Error response from daemon: No such container: x\n"),
+                (0, "", ""),                    # docker rm -f of the old name
+                (0, "container-id-2\n", ""),
+                (0, "ok\n", ""),
+            ]
+            result = await _call_tool(server, "status")
+
+        assert result.content[0].text == "ok"
+        first_start, failed_exec, rm_cmd, second_start, retry_exec = (
+            c.args[0] for c in mock_run.call_args_list
+        )
+        old_name = first_start[first_start.index("--name") + 1]
+        new_name = second_start[second_start.index("--name") + 1]
+        assert new_name != old_name
+        assert failed_exec[6] == old_name
+        assert rm_cmd == ["docker", "rm", "-f", old_name]
+        assert retry_exec[6] == new_name
+        assert retry_exec[5] == failed_exec[5]  # same call marker
+        mock_register.assert_called_once()
+
+    async def test_tool_failure_not_retried(self):
+        server = self._server()
+
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run, \
+                patch("climax.atexit.register"):
+            mock_run.side_effect = [
+                (0, "container-id\n", ""),
+                (128, "", "fatal: not a git repository\n"),
+            ]
+            result = await _call_tool(server, "status")
+
+        assert "[exit code: 128]" in result.content[0].text
+        assert mock_run.call_count == 2
+
+    async def test_start_failure_reported(self):
+        server = self._server()
+
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (125, "", "Unable to find image\n")
+            result = await _call_tool(server, "status")
+
+        assert "Failed to start executor container: Unable to find image" in result.content[0].text
+        mock_run.assert_called_once()
+
+    def test_remove_only_after_start(self):
+        container = DockerContainer(ExecutorConfig(type=ExecutorType.docker, image="img"))
+        with patch("climax.subprocess.run") as mock_sub:
+            container.remove()
+            mock_sub.assert_not_called()
+            container._started = True
+            container.remove()
+        mock_sub.assert_called_once()
+        assert mock_sub.call_args.args[0] == ["docker", "rm", "-f", container.name]
+
+
 @pytest.mark.skipif(not shutil.which("docker"), reason="Docker not available")
 class TestDockerReal:
     """Real Docker integration tests — actually run containers."""
@@ -1,5 +1,6 @@
 """Tests for MCP meta-tools: climax_search, climax_call, default/classic modes, and validate_tool_args."""
 
+import asyncio
 import json
 from unittest.mock import patch, AsyncMock
 
@@ -559,6 +560,175 @@ class TestClassicMode:
 # ---------------------------------------------------------------------------
 
 
+class TestClimaxBatch:
+    """Tests for the opt-in climax_batch meta-tool."""
+
+    def _make_batch_server(self, classic=False):
+        configs = _build_multi_config()
+        tool_map = _build_tool_map(configs)
+        index = ToolIndex.from_configs(configs)
+        return create_server("test-batch", tool_map, index=index, classic=classic, batch=True)
+
+    async def test_not_registered_by_default(self):
+        server, _ = _make_default_server()
+        result = await _list_tools(server)
+        assert "climax_batch" not in {t.name for t in result.tools}
+
+        result = await _call_tool(server, "climax_batch", {"calls": []})
+        assert "Unknown tool" in result.content[0].text
+
+    async def test_registered_when_enabled(self):
+        result = await _list_tools(self._make_batch_server())
+        assert [t.name for t in result.tools] == ["climax_search", "climax_call", "climax_batch"]
+
+        result = await _list_tools(self._make_batch_server(classic=True))
+        names = {t.name for t in result.tools}
+        assert "climax_batch" in names
+        assert "climax_call" not in names
+
+    async def test_results_in_call_order(self):
+        server = self._make_batch_server()
+
+        async def fake_run(cmd, **kwargs):
+            return (0, f"{cmd[1]}\n", "")
+
+        with patch("climax.run_command", side_effect=fake_run) as mock_run:
+            result = await _call_tool(server, "climax_batch", {"calls": [
+                {"tool_name": "git_status"},
+                {"tool_name": "git_commit", "args": {"message": "msg"}},
+                {"tool_name": "docker_ps"},
+            ]})
+
+        data = json.loads(result.content[0].text)
+        assert [r["tool_name"] for r in data["results"]] == ["git_status", "git_commit", "docker_ps"]
+        assert [r["output"] for r in data["results"]] == ["status", "commit", "ps"]
+        assert all(r["ok"] for r in data["results"])
+        assert mock_run.call_count == 3
+
+    async def test_per_call_errors_reported(self):
+        server = self._make_batch_server()
+
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (1, "", "fatal: not a git repository\n")
+            result = await _call_tool(server, "climax_batch", {"calls": [
+                {"tool_name": "git_status"},
+                {"tool_name": "nope"},
+                {"tool_name": "git_commit"},
+            ]})
+
+        results = json.loads(result.content[0].text)["results"]
+        assert not any(r["ok"] for r in results)
+        assert "[exit code: 1]" in results[0]["output"]
+        assert "Unknown tool: nope" in results[1]["output"]
+        assert "Argument validation failed" in results[2]["output"]
+
+    async def test_malformed_entries_reported_per_call(self):
+        server = self._make_batch_server()
+
+        # Bypass the MCP layer's schema check so the handler sees the raw entries
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run, \
+                patch("mcp.server.lowlevel.server.jsonschema.validate"):
+            mock_run.return_value = (0, "ok\n", "")
+            result = await _call_tool(server, "climax_batch", {"calls": [
+                {"tool_name": "git_status", "args": "not-an-object"},
+                {"tool_name": 42},
+                {"tool_name": "git_status"},
+            ]})
+
+        results = json.loads(result.content[0].text)["results"]
+        assert [r["ok"] for r in results] == [False, False, True]
+        assert "'args' must be an object" in results[0]["output"]
+        assert "'tool_name' must be a string" in results[1]["output"]
+        assert mock_run.call_count == 1
+
+    async def test_max_concurrent_limits_running_calls(self):
+        server = self._make_batch_server()
+        running = 0
+        peak = 0
+
+        async def fake_run(cmd, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return (0, "ok\n", "")
+
+        with patch("climax.run_command", side_effect=fake_run):
+            await _call_tool(server, "climax_batch", {
+                "calls": [{"tool_name": "git_status"}] * 6,
+                "max_concurrent": 2,
+            })
+
+        assert peak == 2
+
+    async def test_stop_on_error_skips_pending_calls(self):
+        server = self._make_batch_server()
+
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (1, "", "boom\n")
+            result = await _call_tool(server, "climax_batch", {
+                "calls": [{"tool_name": "git_status"}, {"tool_name": "git_log"}],
+                "max_concurrent": 1,
+                "stop_on_error": True,
+            })
+
+        results = json.loads(result.content[0].text)["results"]
+        mock_run.assert_called_once()
+        assert "skipped" in results[1]["output"]
+
+    async def test_max_concurrent_capped(self):
+        server = self._make_batch_server()
+        running = 0
+        peak = 0
+
+        async def fake_run(cmd, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return (0, "ok\n", "")
+
+        with patch("climax.run_command", side_effect=fake_run):
+            await _call_tool(server, "climax_batch", {
+                "calls": [{"tool_name": "git_status"}] * 40,
+                "max_concurrent": 1000,
+            })
+
+        assert peak == 16
+
+    async def test_too_many_calls_rejected(self):
+        server = self._make_batch_server()
+
+        # Bypass the MCP layer's schema check so the handler's own limit is hit
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run, \
+                patch("mcp.server.lowlevel.server.jsonschema.validate"):
+            result = await _call_tool(server, "climax_batch", {
+                "calls": [{"tool_name": "git_status"}] * 65,
+            })
+
+        assert "Too many calls: 65" in result.content[0].text
+        mock_run.assert_not_called()
+
+    async def test_stop_on_error_must_be_boolean(self):
+        server = self._make_batch_server()
+
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run, \
+                patch("mcp.server.lowlevel.server.jsonschema.validate"):
+            result = await _call_tool(server, "climax_batch", {
+                "calls": [{"tool_name": "git_status"}],
+                "stop_on_error": "false",
+            })
+
+        assert "'stop_on_error' must be a boolean" in result.content[0].text
+        mock_run.assert_not_called()
+
+    async def test_empty_calls(self):
+        result = await _call_tool(self._make_batch_server(), "climax_batch", {"calls": []})
+        assert "Missing required argument 'calls'" in result.content[0].text
+
+
 class TestValidateToolArgs:
     """Unit tests for the validate_tool_args function."""
 
@@ -18,6 +18,7 @@ from climax import (
     ToolPolicy,
     apply_policy,
     load_policy,
+    validate_arguments,
 )
 
 
@@ -49,6 +50,20 @@ class TestLoadPolicy:
         assert policy.default == DefaultPolicy.disabled
         assert policy.executor.type == ExecutorType.local
 
+    def test_non_ascii_description(self, tmp_path):
+        p = tmp_path / "utf8.yaml"
+        p.write_text('tools:\n  hello:\n    description: "Grüße — ✓"\n', encoding="utf-8")
+        policy = load_policy(p)
+        assert policy.tools["hello"].description == "Grüße — ✓"
+
+    def test_repeated_load_cached_until_modified(self, minimal_policy_yaml):
+        first = load_policy(minimal_policy_yaml)
+        assert load_policy(minimal_policy_yaml) is first
+        minimal_policy_yaml.write_text(minimal_policy_yaml.read_text() + "default: enabled\n")
+        second = load_policy(minimal_policy_yaml)
+        assert second is not first
+        assert second.default == DefaultPolicy.enabled
+
     def test_full(self, full_policy_yaml):
         policy = load_policy(full_policy_yaml)
         assert policy.executor.type == ExecutorType.docker
@@ -105,6 +120,26 @@ class TestApplyPolicy:
         assert "hello" in result
         assert "status" in result
 
+    def test_source_tool_map_unchanged(self):
+        tool_map = _build_tool_map()
+        policy = PolicyConfig(
+            tools={"hello": ToolPolicy(
+                description="Custom hello",
+                args={"name": ArgConstraint(pattern="^[a-z]+$")},
+            )},
+        )
+        result = apply_policy(tool_map, policy)
+        assert result["hello"] is not tool_map["hello"]
+        assert tool_map["hello"].description_override is None
+        assert tool_map["hello"].arg_constraints == {}
+        assert result["hello"].build_command({"name": "bob"}) == ["echo", "hello", "bob"]
+
+    def test_models_are_frozen(self, minimal_policy):
+        with pytest.raises(ValidationError):
+            minimal_policy.default = DefaultPolicy.enabled
+        with pytest.raises(ValidationError):
+            _build_tool_map()["hello"].description_override = "changed"
+
     def test_description_override(self):
         tool_map = _build_tool_map()
         policy = PolicyConfig(
@@ -202,3 +237,41 @@ class TestApplyPolicy:
         assert "status" in result
         assert result["hello"].arg_constraints["name"].pattern == "^test$"
         assert len(result["status"].arg_constraints) == 0
+
+
+class TestValidateArguments:
+    def _tool(self):
+        return ToolDef(
+            name="t",
+            description="test",
+            args=[ToolArg(name="name"), ToolArg(name="count", type=ArgType.integer)],
+        )
+
+    def test_invalid_pattern_rejected_at_load(self):
+        with pytest.raises(ValidationError, match="invalid regex"):
+            ArgConstraint(pattern="[unclosed")
+
+    def test_pattern_uses_compiled_regex(self):
+        constraints = {"name": ArgConstraint(pattern="^[a-z]+$")}
+        assert validate_arguments({"name": "abc"}, self._tool(), constraints) == []
+        errors = validate_arguments({"name": "ABC"}, self._tool(), constraints)
+        assert len(errors) == 1
+        assert "does not match pattern '^[a-z]+$'" in errors[0]
+
+    def test_min_and_max(self):
+        constraints = {"count": ArgConstraint(min=1, max=10)}
+        assert validate_arguments({"count": 5}, self._tool(), constraints) == []
+        assert "below minimum" in validate_arguments({"count": 0}, self._tool(), constraints)[0]
+        assert "exceeds maximum" in validate_arguments({"count": 11}, self._tool(), constraints)[0]
+
+    def test_no_constraints_or_arguments(self):
+        assert validate_arguments({"name": "x"}, self._tool(), {}) == []
+        assert validate_arguments({}, self._tool(), {"name": ArgConstraint(pattern="^a$")}) == []
+
+    def test_explicit_none_value_is_skipped(self):
+        constraints = {"count": ArgConstraint(min=1)}
+        assert validate_arguments({"count": None}, self._tool(), constraints) == []
+
+    def test_non_numeric_value_skips_range_checks(self):
+        constraints = {"count": ArgConstraint(min=1, max=10)}
+        assert validate_arguments({"count": "many"}, self._tool(), constraints) == []
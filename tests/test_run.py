@@ -1,18 +1,40 @@
 """Tests for run_command — async subprocess execution."""
 
 import asyncio
+import os
+import signal
+import sys
 from unittest.mock import AsyncMock, patch, MagicMock
 
 import pytest
 
+import climax
 from climax import run_command
 
 
-def _make_proc(returncode=0, stdout=b"", stderr=b""):
-    """Create a mock process with the given outputs."""
-    proc = AsyncMock()
+def _stream(data=b"", eof=True):
+    """Create a StreamReader pre-filled with data (left open if not eof)."""
+    reader = asyncio.StreamReader()
+    if data:
+        reader.feed_data(data)
+    if eof:
+        reader.feed_eof()
+    return reader
+
+
+def _make_proc(returncode=0, stdout=b"", stderr=b"", hang=False):
+    """Create a mock process with the given outputs.
+
+    With hang=True the stdout pipe never reaches EOF, simulating a process
+    that runs past its timeout.
+    """
+    proc = MagicMock()
     proc.returncode = returncode
-    proc.communicate = AsyncMock(return_value=(stdout, stderr))
+    proc.stdout = _stream(stdout, eof=not hang)
+    proc.stderr = _stream(stderr)
+    proc.stdin = MagicMock()
+    proc.stdin.drain = AsyncMock()
+    proc.wait = AsyncMock(return_value=returncode)
     proc.kill = MagicMock()
     return proc
 
@@ -51,6 +73,30 @@ class TestRunCommand:
         # Should also contain inherited env vars
         assert "PATH" in env
 
+    async def test_merged_env_reused_across_calls(self):
+        proc = _make_proc(returncode=0, stdout=b"")
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc) as mock_exec:
+            await run_command(["cmd"], env={"MY_VAR": "42"})
+            await run_command(["cmd"], env={"MY_VAR": "42"})
+        first, second = (c.kwargs["env"] for c in mock_exec.call_args_list)
+        assert first is second
+
+    async def test_no_overrides_uses_env_snapshot(self):
+        proc = _make_proc(returncode=0, stdout=b"")
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc) as mock_exec:
+            await run_command(["cmd"])
+        assert mock_exec.call_args.kwargs["env"] is climax._BASE_ENV
+
+    async def test_env_changes_after_import_seen_by_no_tool(self, monkeypatch):
+        monkeypatch.setenv("CLIMAX_LATE_VAR", "late")
+        proc = _make_proc(returncode=0, stdout=b"")
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc) as mock_exec:
+            await run_command(["cmd"])
+            await run_command(["cmd"], env={"MY_VAR": "42"})
+        plain, overridden = (c.kwargs["env"] for c in mock_exec.call_args_list)
+        assert "CLIMAX_LATE_VAR" not in plain
+        assert "CLIMAX_LATE_VAR" not in overridden
+
     async def test_working_dir(self):
         proc = _make_proc(returncode=0, stdout=b"")
         with patch("climax.asyncio.create_subprocess_exec", return_value=proc) as mock_exec:
@@ -59,14 +105,80 @@ class TestRunCommand:
         cwd = call_kwargs.kwargs.get("cwd") or call_kwargs[1].get("cwd")
         assert cwd == "/tmp"
 
-    async def test_timeout_kills_process(self):
-        proc = _make_proc()
-        proc.communicate = AsyncMock(side_effect=asyncio.TimeoutError)
-        with patch("climax.asyncio.create_subprocess_exec", return_value=proc):
+    async def test_timeout_terminates_process(self):
+        proc = _make_proc(hang=True)
+        proc.returncode = None
+
+        async def wait():
+            proc.returncode = -signal.SIGTERM
+            return proc.returncode
+
+        proc.wait = AsyncMock(side_effect=wait)
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc), \
+                patch("climax._NEW_SESSION", False):
             rc, out, err = await run_command(["sleep", "100"], timeout=0.1)
         assert rc == -1
         assert "timed out" in err.lower()
+        proc.terminate.assert_called_once()
+        proc.kill.assert_not_called()
+        proc.wait.assert_awaited()
+
+    async def test_timeout_escalates_to_kill(self):
+        proc = _make_proc(hang=True)
+        proc.returncode = None
+        first_wait = True
+
+        async def wait():
+            nonlocal first_wait
+            if first_wait:
+                first_wait = False
+                await asyncio.sleep(10)  # ignores SIGTERM
+            proc.returncode = -signal.SIGKILL
+            return proc.returncode
+
+        proc.wait = AsyncMock(side_effect=wait)
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc), \
+                patch("climax._NEW_SESSION", False), \
+                patch("climax._KILL_GRACE", 0.05):
+            rc, _, _ = await run_command(["sleep", "100"], timeout=0.1)
+        assert rc == -1
+        proc.terminate.assert_called_once()
         proc.kill.assert_called_once()
+        assert proc.returncode == -signal.SIGKILL
+
+    async def test_timeout_kills_process_group(self):
+        proc = _make_proc(hang=True)
+        proc.pid = 424242
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc) as mock_exec, \
+                patch("climax._NEW_SESSION", True), \
+                patch("climax.os.killpg", create=True) as mock_killpg:
+            rc, _, _ = await run_command(["sleep", "100"], timeout=0.1)
+        assert rc == -1
+        assert mock_exec.call_args.kwargs["start_new_session"] is True
+        assert mock_killpg.call_args_list == [
+            ((424242, signal.SIGTERM),),
+            ((424242, signal.SIGKILL),),
+        ]
+        proc.terminate.assert_not_called()
+        proc.kill.assert_not_called()
+
+    async def test_timeout_keeps_partial_output(self):
+        proc = _make_proc(stdout=b"partial\n", stderr=b"progress\n", hang=True)
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc), \
+                patch("climax._NEW_SESSION", False):
+            rc, out, err = await run_command(["sleep", "100"], timeout=0.1)
+        assert rc == -1
+        assert out == "partial\n"
+        assert err.startswith("progress")
+        assert "timed out" in err.lower()
+
+    async def test_output_capped(self):
+        proc = _make_proc(returncode=0, stdout=b"x" * 100)
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc):
+            with patch("climax.MAX_OUTPUT_BYTES", 10):
+                rc, out, err = await run_command(["cmd"])
+        assert rc == 0
+        assert out == "x" * 10 + "\n[output truncated at 10 bytes]"
 
     async def test_command_not_found(self):
         with patch(
@@ -77,6 +189,41 @@ class TestRunCommand:
         assert rc == -1
         assert "not found" in err.lower()
 
+    async def test_executable_resolved_once(self, monkeypatch):
+        monkeypatch.setattr(climax, "_which_cache", {})
+        proc = _make_proc(returncode=0)
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc) as mock_exec, \
+                patch("climax.shutil.which", return_value="/usr/bin/tool") as mock_which:
+            await run_command(["tool", "a"])
+            await run_command(["tool", "b"])
+        mock_which.assert_called_once_with("tool", path=climax._BASE_ENV.get("PATH", os.defpath))
+        assert mock_exec.call_args.args == ("tool", "b")
+        assert mock_exec.call_args.kwargs["executable"] == "/usr/bin/tool"
+
+    async def test_executable_resolved_against_env_snapshot(self, monkeypatch):
+        monkeypatch.setattr(climax, "_which_cache", {})
+        monkeypatch.setattr(climax, "_BASE_ENV", {"PATH": "/snapshot/bin"})
+        monkeypatch.setenv("PATH", "/live/bin")
+        proc = _make_proc(returncode=0)
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc), \
+                patch("climax.shutil.which", return_value="/snapshot/bin/tool") as mock_which:
+            await run_command(["tool"])
+        mock_which.assert_called_once_with("tool", path="/snapshot/bin")
+
+    async def test_executable_cache_dropped_on_not_found(self, monkeypatch):
+        monkeypatch.setattr(climax, "_which_cache", {"tool": "/gone/tool"})
+        with patch("climax.asyncio.create_subprocess_exec", side_effect=FileNotFoundError):
+            rc, _, _ = await run_command(["tool"])
+        assert rc == -1
+        assert "tool" not in climax._which_cache
+
+    async def test_executable_not_cached_with_path_override(self, monkeypatch):
+        monkeypatch.setattr(climax, "_which_cache", {"tool": "/usr/bin/tool"})
+        proc = _make_proc(returncode=0)
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc) as mock_exec:
+            await run_command(["tool"], env={"PATH": "/opt/bin"})
+        assert mock_exec.call_args.kwargs["executable"] == "tool"
+
     async def test_stdin_devnull_by_default(self):
         """Without stdin_data, stdin should be DEVNULL (not inherited)."""
         proc = _make_proc(returncode=0, stdout=b"ok\n")
@@ -92,7 +239,39 @@ class TestRunCommand:
             await run_command(["cmd"], stdin_data="hello world")
         call_kwargs = mock_exec.call_args
         assert call_kwargs.kwargs["stdin"] == asyncio.subprocess.PIPE
-        proc.communicate.assert_called_once_with(input=b"hello world")
+        proc.stdin.write.assert_called_once_with(b"hello world")
+        proc.stdin.close.assert_called_once()
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="reads /proc")
+    async def test_integration_timeout_kills_grandchildren(self):
+        rc, out, _ = await run_command(
+            ["sh", "-c", "sleep 30 & echo $!; wait"], timeout=0.5,
+        )
+        assert rc == -1
+        grandchild = int(out.strip())
+        for _ in range(50):
+            try:
+                with open(f"/proc/{grandchild}/stat") as f:
+                    if f.read().split(") ", 1)[1].startswith("Z"):
+                        break
+            except FileNotFoundError:
+                break
+            await asyncio.sleep(0.02)
+        else:
+            os.kill(grandchild, signal.SIGKILL)
+            pytest.fail("grandchild survived the timeout")
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX signals")
+    async def test_integration_timeout_kills_sigterm_ignorer(self):
+        with patch("climax._KILL_GRACE", 0.2):
+            loop = asyncio.get_running_loop()
+            t0 = loop.time()
+            rc, _, err = await run_command(
+                ["sh", "-c", "trap '' TERM; sleep 30"], timeout=0.3,
+            )
+        assert rc == -1
+        assert "timed out" in err
+        assert loop.time() - t0 < 5
 
     async def test_integration_echo(self):
         """Integration test with a real command."""
@@ -100,8 +279,30 @@ class TestRunCommand:
         assert rc == 0
         assert "integration test" in out
 
+    async def test_integration_large_output(self):
+        """Output larger than one read chunk is collected in full."""
+        rc, out, err = await run_command(["head", "-c", "200000", "/dev/zero"])
+        assert rc == 0
+        assert len(out) == 200000
+
+    async def test_integration_env_override(self):
+        """Config env overrides reach the child alongside the inherited env."""
+        rc, out, err = await run_command(
+            ["printenv", "CLIMAX_TEST_VAR", "PATH"], env={"CLIMAX_TEST_VAR": "hello"},
+        )
+        assert rc == 0
+        assert out.splitlines()[0] == "hello"
+        assert len(out.splitlines()) == 2
+
     async def test_integration_stdin_cat(self):
         """Integration test: pipe data via stdin to cat."""
         rc, out, err = await run_command(["cat"], stdin_data="piped content")
         assert rc == 0
         assert "piped content" in out
+
+    async def test_invalid_utf8_replaced(self):
+        proc = _make_proc(returncode=0, stdout=b"ok \xff\n", stderr=b"")
+        with patch("climax.asyncio.create_subprocess_exec", return_value=proc):
+            rc, out, err = await run_command(["cmd"])
+        assert out == "ok �\n"
+        assert err == ""
@@ -97,3 +97,12 @@ class TestBuildInputSchema:
         assert prop["default"] == "json"
         assert prop["enum"] == ["json", "table"]
         assert schema["required"] == ["format"]
+
+    def test_props_do_not_share_state(self):
+        args = [
+            ToolArg(name="a", type=ArgType.string, description="First"),
+            ToolArg(name="b", type=ArgType.string),
+        ]
+        schema = build_input_schema(args)
+        assert schema["properties"]["b"] == {"type": "string"}
+        assert build_input_schema([ToolArg(name="c")])["properties"]["c"] == {"type": "string"}
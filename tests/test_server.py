@@ -5,6 +5,7 @@ from unittest.mock import patch, AsyncMock
 import pytest
 
 import mcp.types as types
+from pydantic import ValidationError
 
 from climax import (
     ArgConstraint,
@@ -70,6 +71,17 @@ class TestMCPServer:
         assert "name" in greet_tool.inputSchema["properties"]
         assert greet_tool.inputSchema["required"] == ["name"]
 
+    async def test_list_tools_repeated_calls_identical(self):
+        tool_map = _build_tool_map()
+        server = create_server("test", tool_map)
+
+        handlers = server.request_handlers
+        request = types.ListToolsRequest(method="tools/list")
+        first = _unwrap(await handlers[types.ListToolsRequest](request))
+        second = _unwrap(await handlers[types.ListToolsRequest](request))
+        assert [t.name for t in first.tools] == [t.name for t in second.tools]
+        assert all(a is b for a, b in zip(first.tools, second.tools))
+
     async def test_call_tool_success(self):
         tool_map = _build_tool_map()
         server = create_server("test", tool_map)
@@ -210,6 +222,30 @@ class TestMCPServer:
         # Log should contain truncation marker
         assert any("bytes]" in record.message for record in caplog.records)
 
+    async def test_call_tool_no_command_log_at_warning(self, caplog):
+        """The command line is not logged when INFO is filtered out."""
+        tool_map = {
+            "greet": ResolvedTool(
+                tool=ToolDef(name="greet", description="Say hello", command="hello"),
+                base_command="echo",
+            ),
+        }
+        server = create_server("test", tool_map)
+
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, "ok\n", "")
+
+            import logging
+            with caplog.at_level(logging.WARNING, logger="climax"):
+                handlers = server.request_handlers
+                request = types.CallToolRequest(
+                    method="tools/call",
+                    params=types.CallToolRequestParams(name="greet", arguments={}),
+                )
+                await handlers[types.CallToolRequest](request)
+
+        assert not any("▶" in record.message for record in caplog.records)
+
 
     async def test_cwd_arg_sets_working_dir(self):
         """A cwd arg should override working_dir passed to run_command."""
@@ -413,6 +449,66 @@ class TestMCPServerGlobalArgs:
         assert "vault" not in search_tool.inputSchema["properties"]
 
 
+class TestMCPServerBuiltin:
+    """Tests for tools answered in-process via ``builtin``."""
+
+    async def _call(self, tool_map, name, arguments):
+        server = create_server("test", tool_map)
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name=name, arguments=arguments),
+        )
+        return _unwrap(await server.request_handlers[types.CallToolRequest](request))
+
+    async def test_builtin_skips_subprocess(self):
+        tool_map = {
+            "echo": ResolvedTool(
+                tool=ToolDef(
+                    name="echo",
+                    description="Echo arguments",
+                    builtin="echo_json",
+                    args=[ToolArg(name="msg")],
+                ),
+                base_command="false",
+            ),
+        }
+        with patch("climax.run_command", new_callable=AsyncMock) as mock_run:
+            result = await self._call(tool_map, "echo", {"msg": "hi"})
+
+        mock_run.assert_not_called()
+        assert result.content[0].text == '{"msg": "hi"}'
+
+    async def test_pwd_uses_cwd_arg(self, tmp_path):
+        tool_map = {
+            "where": ResolvedTool(
+                tool=ToolDef(
+                    name="where",
+                    description="Working directory",
+                    builtin="pwd",
+                    args=[ToolArg(name="dir", cwd=True)],
+                ),
+                base_command="pwd",
+                working_dir="/",
+            ),
+        }
+        result = await self._call(tool_map, "where", {"dir": str(tmp_path)})
+        assert result.content[0].text == str(tmp_path)
+
+    async def test_noop_reports_no_output(self):
+        tool_map = {
+            "nothing": ResolvedTool(
+                tool=ToolDef(name="nothing", description="Do nothing", builtin="noop"),
+                base_command="true",
+            ),
+        }
+        result = await self._call(tool_map, "nothing", {})
+        assert result.content[0].text == "(no output)"
+
+    def test_unknown_builtin_rejected(self):
+        with pytest.raises(ValidationError, match="unknown builtin"):
+            ToolDef(name="bad", description="Bad", builtin="nope")
+
+
 class TestMCPServerPolicy:
     """Tests for policy-aware server behavior."""
 